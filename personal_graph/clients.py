@@ -1,14 +1,37 @@
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Optional
 from dotenv import load_dotenv
 from personal_graph.embeddings import OpenAIEmbeddingsModel, OllamaEmbeddingModel
+from personal_graph.embeddings_cache import EmbeddingsCache
 
+import httpx
 import openai
 import ollama  # type: ignore
 
+try:
+    import h2  # type: ignore # noqa: F401
+
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
 load_dotenv()
 
+# Embedding requests are many and small, so keep connections alive and, when h2 is
+# installed, multiplex them over HTTP/2
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+HTTP_TIMEOUT = httpx.Timeout(60, connect=10)
+
+
+def _create_http_client() -> httpx.Client:
+    return httpx.Client(http2=HTTP2, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+def _create_async_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(http2=HTTP2, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
 
 class APIClient(ABC):
     @abstractmethod
@@ -31,17 +54,32 @@ class OpenAIEmbeddingClient(EmbeddingClient):
     dimensions: int = 384
     model_name: str = "text-embedding-3-small"
     api_key: str = ""
+    cache_dir: Optional[str] = None
 
     def __post_init__(self, *args, **kwargs):
         self.client = self._create_default_client(*args, **kwargs)
+        self.async_client = self._create_default_async_client(*args, **kwargs)
 
     def _create_default_client(self, *args, **kwargs):
+        kwargs.setdefault("http_client", _create_http_client())
         return openai.OpenAI(
             api_key=os.getenv("OPENAI_API_KEY", self.api_key), *args, **kwargs
         )
 
+    def _create_default_async_client(self, *args, **kwargs):
+        kwargs.setdefault("http_client", _create_async_http_client())
+        return openai.AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY", self.api_key), *args, **kwargs
+        )
+
     def get_embedding_model(self):
-        return OpenAIEmbeddingsModel(self.client, self.model_name, self.dimensions)
+        return OpenAIEmbeddingsModel(
+            self.client,
+            self.model_name,
+            self.dimensions,
+            disk_cache=EmbeddingsCache(self.cache_dir) if self.cache_dir else None,
+            async_client=self.async_client,
+        )
 
 
 @dataclass
@@ -49,11 +87,14 @@ class LiteLLMEmbeddingClient(APIClient):
     model_name: str = "openai/text-embedding-3-small"
     dimensions: int = 384
     base_url: str = ""
+    cache_dir: Optional[str] = None
 
     def __post_init__(self, *args, **kwargs):
         self.client = self._create_default_client(*args, **kwargs)
+        self.async_client = self._create_default_async_client(*args, **kwargs)
 
     def _create_default_client(self, *args, **kwargs):
+        kwargs.setdefault("http_client", _create_http_client())
         return openai.OpenAI(
             api_key="",
             base_url=os.getenv("LITE_LLM_BASE_URL", self.base_url),
@@ -64,8 +105,26 @@ class LiteLLMEmbeddingClient(APIClient):
             **kwargs,
         )
 
+    def _create_default_async_client(self, *args, **kwargs):
+        kwargs.setdefault("http_client", _create_async_http_client())
+        return openai.AsyncOpenAI(
+            api_key="",
+            base_url=os.getenv("LITE_LLM_BASE_URL", self.base_url),
+            default_headers={
+                "Authorization": f"Bearer {os.getenv('LITE_LLM_TOKEN', '')}"
+            },
+            *args,
+            **kwargs,
+        )
+
     def get_embedding_model(self):
-        return OpenAIEmbeddingsModel(self.client, self.model_name, self.dimensions)
+        return OpenAIEmbeddingsModel(
+            self.client,
+            self.model_name,
+            self.dimensions,
+            disk_cache=EmbeddingsCache(self.cache_dir) if self.cache_dir else None,
+            async_client=self.async_client,
+        )
 
 
 @dataclass
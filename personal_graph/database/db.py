@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Optional, List, Union
+from typing import Any, Callable, Dict, Optional, List, Tuple, Union
 from graphviz import Digraph  # type: ignore
 
 from personal_graph.models import Node, Edge
@@ -43,6 +43,14 @@ class DB(ABC):
         """Fetch the embedding IDs of edges given a node or edge ID"""
         pass
 
+    @abstractmethod
+    def fetch_nodes_embed_ids(
+        self, ids: List[Any]
+    ) -> Tuple[List[Any], List[Any], List[Any]]:
+        """Fetch the existing IDs among the given node IDs, their embedding IDs and
+        the embedding IDs of every edge touching them"""
+        pass
+
     @abstractmethod
     def all_connected_nodes(self, node_or_edge: Union[Node | Edge]) -> Any:
         """Retrieve all nodes connected to a given node or edge"""
@@ -78,6 +86,11 @@ class DB(ABC):
         """Remove a node from the database"""
         pass
 
+    @abstractmethod
+    def remove_nodes(self, ids: List[Any]) -> None:
+        """Remove several nodes and their edges from the database"""
+        pass
+
     @abstractmethod
     def search_node(self, node_id: Any) -> Any:
         """Search for a node by its ID"""
@@ -127,6 +140,16 @@ class DB(ABC):
         """Fetch all IDs from the database"""
         pass
 
+    @abstractmethod
+    def dump_all_nodes(self) -> List[Any]:
+        """Fetch the id, label and attributes of every node"""
+        pass
+
+    @abstractmethod
+    def dump_all_edges(self) -> List[Any]:
+        """Fetch the source, target, label and attributes of every edge"""
+        pass
+
     @abstractmethod
     def search_indegree_edges(self, target: Any) -> List[Any]:
         """Search for edges with the given target node"""
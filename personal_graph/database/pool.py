@@ -0,0 +1,62 @@
+"""
+Bounded pool of reusable database connections
+"""
+
+import atexit
+import queue
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+class ConnectionPool:
+    def __init__(self, connect: Callable[[], Any], *, max_size: int = 8) -> None:
+        self._connect = connect
+        self.max_size = max_size
+        # LIFO hands out the most recently used, still warm, connection first
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max_size)
+        atexit.register(self.close)
+
+    def __repr__(self) -> str:
+        return f"ConnectionPool(max_size={self.max_size}, idle={self._idle.qsize()})"
+
+    def get(self) -> Any:
+        """Take an idle connection, opening a new one when none is left"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def put(self, connection: Any) -> None:
+        """Return a healthy connection, closing it if the pool is already full"""
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            self.discard(connection)
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """Lend a connection for the duration of the block, dropping it instead of
+        returning it to the pool if the block raises"""
+
+        connection = self.get()
+        try:
+            yield connection
+        except BaseException:
+            # The connection may be left mid-transaction, never reuse it
+            self.discard(connection)
+            raise
+
+        self.put(connection)
+
+    def discard(self, connection: Any) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        while True:
+            try:
+                self.discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
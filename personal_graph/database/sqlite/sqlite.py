@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 import sqlean as sqlite3  # type: ignore
@@ -7,10 +6,11 @@ from functools import lru_cache
 from graphviz import Digraph  # type: ignore
 from typing import Any, Callable, Dict, Optional, List, Union, Tuple
 from personal_graph.models import Node, Edge
-from jinja2 import BaseLoader, Environment, select_autoescape
+from jinja2 import BaseLoader, Environment, Template, select_autoescape
 
 from personal_graph.visualizers import _as_dot_node, _as_dot_label
 from personal_graph.database.db import DB
+from personal_graph.serialization import dumps, loads
 
 CursorExecFunction = Callable[[sqlite3.Cursor, sqlite3.Connection], Any]
 
@@ -21,6 +21,20 @@ def read_sql(sql_file: Path) -> str:
         return f.read()
 
 
+def load_sql_dir(path: Path) -> Dict[str, str]:
+    """Read every query file in a directory, keyed by file name"""
+    return {sql_file.name: sql_file.read_text() for sql_file in path.glob("*.sql")}
+
+
+SQL: Dict[str, str] = load_sql_dir(Path(__file__).parent / "raw-queries")
+
+
+@lru_cache(maxsize=1024)
+def render_template(template: Template, **kwargs: Any) -> str:
+    """Render a query template once per distinct set of (hashable) arguments"""
+    return template.render(**kwargs)
+
+
 class SqlTemplateLoader(BaseLoader):
     def __init__(self, templates_dir: Path):
         self.templates_dir = templates_dir
@@ -38,6 +52,10 @@ class SqlTemplateLoader(BaseLoader):
 
 
 class SQLite(DB):
+    # SQLite limits the number of bound parameters in a single statement, and
+    # deleting edges binds every id twice
+    remove_batch_size: int = 400
+
     def __init__(
         self,
         *,
@@ -85,9 +103,10 @@ class SQLite(DB):
                 self._connection.load_extension(self.vector0_so_path)
                 self._connection.load_extension(self.vss0_so_path)
 
+            self._connection.executescript(SQL["pragmas.sql"])
+
         try:
             cursor = self._connection.cursor()
-            cursor.execute("PRAGMA foreign_keys = TRUE;")
             results = cursor_exec_fn(cursor, self._connection)
             self._connection.commit()
         finally:
@@ -99,7 +118,7 @@ class SQLite(DB):
 
     def initialize(self):
         def _init(cursor, connection):
-            schema_sql = read_sql(Path("schema.sql"))
+            schema_sql = SQL["schema.sql"]
             connection.executescript(schema_sql)
             connection.commit()
 
@@ -126,11 +145,11 @@ class SQLite(DB):
         set_data = self._set_id(identifier, data)
 
         cursor.execute(
-            read_sql(Path("insert-node.sql")),
+            SQL["insert-node.sql"],
             (
                 count,
                 label,
-                json.dumps(set_data),
+                dumps(set_data),
             ),
         )
         connection.commit()
@@ -162,13 +181,13 @@ class SQLite(DB):
             )
 
             cursor.execute(
-                read_sql(Path("insert-edge.sql")),
+                SQL["insert-edge.sql"],
                 (
                     count,
                     source_id,
                     target_id,
                     label,
-                    json.dumps(attributes),
+                    dumps(attributes),
                 ),
             )
 
@@ -192,16 +211,24 @@ class SQLite(DB):
 
         if tree:
             if tree_with_key:
-                return self.clause_template.render(
-                    and_or=joiner, key=key, tree=tree, predicate=predicate
+                return render_template(
+                    self.clause_template,
+                    and_or=joiner,
+                    key=key,
+                    tree=tree,
+                    predicate=predicate,
                 )
             else:
-                return self.clause_template.render(
-                    and_or=joiner, tree=tree, predicate=predicate
+                return render_template(
+                    self.clause_template, and_or=joiner, tree=tree, predicate=predicate
                 )
 
-        return self.clause_template.render(
-            and_or=joiner, key=key, predicate=predicate, key_value=True
+        return render_template(
+            self.clause_template,
+            and_or=joiner,
+            key=key,
+            predicate=predicate,
+            key_value=True,
         )
 
     def _generate_query(
@@ -219,28 +246,36 @@ class SQLite(DB):
 
         if tree:
             if key:
-                return self.search_template.render(
+                return render_template(
+                    self.search_template,
                     result_column=result_column,
                     tree=tree,
                     key=key,
-                    search_clauses=where_clauses,
+                    search_clauses=tuple(where_clauses),
                 )
             else:
-                return self.search_template.render(
-                    result_column=result_column, tree=tree, search_clauses=where_clauses
+                return render_template(
+                    self.search_template,
+                    result_column=result_column,
+                    tree=tree,
+                    search_clauses=tuple(where_clauses),
                 )
 
-        return self.search_template.render(
-            result_column=result_column, search_clauses=where_clauses
+        return render_template(
+            self.search_template,
+            result_column=result_column,
+            search_clauses=tuple(where_clauses),
         )
 
     def _find_node(self, identifier: Any) -> CursorExecFunction:
         def _find_single_node(cursor, connection):
-            query = self._generate_query([self.clause_template.render(id_lookup=True)])
+            query = self._generate_query(
+                [render_template(self.clause_template, id_lookup=True)]
+            )
             result = cursor.execute(query, (identifier,)).fetchone()
             if result:
                 if isinstance(result[0], str):
-                    return json.loads(result[0])
+                    return loads(result[0])
                 else:
                     return result[0]
             else:
@@ -252,7 +287,7 @@ class SQLite(DB):
         def _search_edge(cursor, connection):
             new_edge = cursor.execute(
                 "SELECT embed_id from edges where source=? AND target=? AND attributes = json(?) LIMIT ?",
-                (source, target, json.dumps(attributes), limit),
+                (source, target, dumps(attributes), limit),
             )
             result = new_edge.fetchone()
 
@@ -281,10 +316,10 @@ class SQLite(DB):
         )
 
         cursor.execute(
-            read_sql(Path("update-node.sql")),
+            SQL["update-node.sql"],
             (
                 label,
-                json.dumps(self._set_id(identifier, updated_data)),
+                dumps(self._set_id(identifier, updated_data)),
                 count,
                 identifier,
             ),
@@ -301,27 +336,31 @@ class SQLite(DB):
     def _remove_node(self, identifier: Any) -> CursorExecFunction:
         def _remove_single_node(cursor, connection):
             cursor.execute(
-                read_sql(Path("delete-edge.sql")),
+                SQL["delete-edge.sql"],
                 (
                     identifier,
                     identifier,
                 ),
             )
 
-            cursor.execute(read_sql(Path("delete-node.sql")), (identifier,))
+            cursor.execute(SQL["delete-node.sql"], (identifier,))
 
         return _remove_single_node
 
     def _find_neighbors(self, with_bodies: bool = False) -> str:
-        return self.traverse_template.render(
-            with_bodies=with_bodies, inbound=True, outbound=True
+        return render_template(
+            self.traverse_template, with_bodies=with_bodies, inbound=True, outbound=True
         )
 
     def _find_outbound_neighbors(self, with_bodies: bool = False) -> str:
-        return self.traverse_template.render(with_bodies=with_bodies, outbound=True)
+        return render_template(
+            self.traverse_template, with_bodies=with_bodies, outbound=True
+        )
 
     def _find_inbound_neighbors(self, with_bodies: bool = False) -> str:
-        return self.traverse_template.render(with_bodies=with_bodies, inbound=True)
+        return render_template(
+            self.traverse_template, with_bodies=with_bodies, inbound=True
+        )
 
     def _traverse(
         self,
@@ -332,7 +371,10 @@ class SQLite(DB):
     ) -> List:
         def _traverse_graph(cursor, connection):
             path = []
-            target = json.dumps(tgt)
+            # Ids already on the path, so membership checks don't scan the list
+            visited = set()
+            # nodes.id is a text column, so integer targets are compared as text
+            target = str(tgt) if tgt is not None else None
             rows = cursor.execute(
                 neighbors_fn(with_bodies=with_bodies), (src,)
             ).fetchall()
@@ -345,7 +387,8 @@ class SQLite(DB):
                             break
                     else:
                         identifier = row[0]
-                        if identifier not in path:
+                        if identifier not in visited:
+                            visited.add(identifier)
                             path.append(identifier)
                             if identifier == target:
                                 break
@@ -354,7 +397,7 @@ class SQLite(DB):
         return self.atomic(_traverse_graph)
 
     def _parse_search_results(self, results: List[Tuple], idx: int = 0) -> List[Dict]:
-        return [json.loads(item[idx]) for item in results]
+        return [loads(item[idx]) for item in results]
 
     def _find_nodes(
         self,
@@ -372,10 +415,10 @@ class SQLite(DB):
         return _find_multi_nodes
 
     def _connections_in(self) -> str:
-        return read_sql(Path("search-edges-inbound.sql"))
+        return SQL["search-edges-inbound.sql"]
 
     def _connections_out(self) -> str:
-        return read_sql(Path("search-edges-outbound.sql"))
+        return SQL["search-edges-outbound.sql"]
 
     def _get_connections_one_way(
         self,
@@ -452,7 +495,7 @@ class SQLite(DB):
     def get_connections(self, identifier: Any) -> CursorExecFunction:
         def _get_all_connections(cursor, connection):
             return cursor.execute(
-                read_sql(Path("search-edges.sql")),
+                SQL["search-edges.sql"],
                 (
                     identifier,
                     identifier,
@@ -494,7 +537,7 @@ class SQLite(DB):
         upsert_node_func = self._upsert_node(
             identifier=node.id,
             label=node.label,
-            data=json.loads(node.attributes)
+            data=loads(node.attributes)
             if isinstance(node.attributes, str)
             else node.attributes,
         )
@@ -503,6 +546,44 @@ class SQLite(DB):
     def remove_node(self, id: Any) -> None:
         self.atomic(self._remove_node(id))
 
+    def remove_nodes(self, ids: List[Any]) -> None:
+        def _remove_many_nodes(cursor, connection):
+            for start in range(0, len(ids), self.remove_batch_size):
+                chunk = list(ids[start : start + self.remove_batch_size])
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"DELETE FROM edges WHERE source IN ({placeholders}) OR target IN ({placeholders})",
+                    chunk * 2,
+                )
+                cursor.execute(f"DELETE FROM nodes WHERE id IN ({placeholders})", chunk)
+
+        self.atomic(_remove_many_nodes)
+
+    def fetch_nodes_embed_ids(
+        self, ids: List[Any]
+    ) -> Tuple[List[Any], List[Any], List[Any]]:
+        def _fetch_embed_ids(cursor, connection):
+            # Keyed by id, so an edge between two of the nodes is kept once
+            nodes: Dict[Any, Any] = {}
+            edges: Dict[Any, None] = {}
+            for start in range(0, len(ids), self.remove_batch_size):
+                chunk = list(ids[start : start + self.remove_batch_size])
+                placeholders = ",".join("?" * len(chunk))
+                for id, embed_id in cursor.execute(
+                    f"SELECT id, embed_id FROM nodes WHERE id IN ({placeholders})",
+                    chunk,
+                ):
+                    nodes[id] = (embed_id,)
+                for row in cursor.execute(
+                    f"SELECT embed_id FROM edges WHERE source IN ({placeholders}) OR target IN ({placeholders})",
+                    chunk * 2,
+                ):
+                    edges[tuple(row)] = None
+
+            return list(nodes), list(nodes.values()), list(edges)
+
+        return self.atomic(_fetch_embed_ids)
+
     def search_node(self, node_id: Any) -> Any:
         return self.atomic(self._find_node(node_id))
 
@@ -595,7 +676,7 @@ class SQLite(DB):
                 for edge in connections(i):  # type: ignore
                     if edge not in edges:
                         _, src, tgt, _, prps, _, _ = edge
-                        props = json.loads(prps)
+                        props = loads(prps)
                         dot.edge(
                             str(src),
                             str(tgt),
@@ -620,6 +701,20 @@ class SQLite(DB):
 
         return self.atomic(_fetch_nodes_from_db)
 
+    def dump_all_nodes(self) -> List[Any]:
+        def _dump_nodes(cursor, connection):
+            return cursor.execute("SELECT id, label, attributes FROM nodes").fetchall()
+
+        return self.atomic(_dump_nodes)
+
+    def dump_all_edges(self) -> List[Any]:
+        def _dump_edges(cursor, connection):
+            return cursor.execute(
+                "SELECT source, target, label, attributes FROM edges"
+            ).fetchall()
+
+        return self.atomic(_dump_edges)
+
     def search_indegree_edges(
         self, target: Any, limit: Optional[int] = 10
     ) -> List[Any]:
@@ -657,7 +752,7 @@ class SQLite(DB):
     ):
         def _search_node(cursor, connection):
             nodes = cursor.execute(
-                read_sql(Path("search-node-by-rowid.sql")),
+                SQL["search-node-by-rowid.sql"],
                 (embed_ids, sort_by, desc, sort_by, sort_by, desc, sort_by),
             )
 
@@ -668,7 +763,7 @@ class SQLite(DB):
     def search_similar_edges(self, embed_ids, *, desc: bool = False, sort_by: str = ""):
         def _search_edge(cursor, connection):
             edges = cursor.execute(
-                read_sql(Path("search-edge-by-rowid.sql")),
+                SQL["search-edge-by-rowid.sql"],
                 (embed_ids, sort_by, desc, sort_by, sort_by, desc, sort_by),
             )
 
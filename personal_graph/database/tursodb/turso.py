@@ -5,6 +5,7 @@ from typing import Optional, Any, Callable, Tuple
 
 from jinja2 import BaseLoader, Environment, select_autoescape
 from personal_graph.database.db import CursorExecFunction
+from personal_graph.database.pool import ConnectionPool
 from personal_graph.database.sqlite.sqlite import SQLite
 
 try:
@@ -36,9 +37,16 @@ class SqlTemplateLoader(BaseLoader):
 
 
 class TursoDB(SQLite):
-    def __init__(self, *, url: Optional[str] = None, auth_token: Optional[str] = None):
+    def __init__(
+        self,
+        *,
+        url: Optional[str] = None,
+        auth_token: Optional[str] = None,
+        pool_size: int = 8,
+    ):
         self.db_url = url
         self.db_auth_token = auth_token
+        self.pool = ConnectionPool(self._connect, max_size=pool_size)
 
         self.env = Environment(
             loader=SqlTemplateLoader(Path(__file__).parent / "raw-queries"),
@@ -59,17 +67,17 @@ class TursoDB(SQLite):
             f"  ),"
         )
 
-    def atomic(self, cursor_exec_fn: CursorExecFunction) -> Any:
-        self._connection = libsql.connect(
-            database=self.db_url,
-            auth_token=self.db_auth_token,
-        )
+    def _connect(self) -> Any:
+        connection = libsql.connect(database=self.db_url, auth_token=self.db_auth_token)
+        connection.execute("PRAGMA foreign_keys = TRUE;")
+        return connection
 
-        cursor = self._connection.cursor()
-        cursor.execute("PRAGMA foreign_keys = TRUE;")
-        results = cursor_exec_fn(cursor, self._connection)
-        self._connection.commit()
+    def atomic(self, cursor_exec_fn: CursorExecFunction) -> Any:
+        with self.pool.acquire() as connection:
+            results = cursor_exec_fn(connection.cursor(), connection)
+            connection.commit()
         return results
 
     def save(self):
-        self._connection.commit()
+        # Every atomic call commits before handing its connection back
+        pass
@@ -2,25 +2,55 @@
 Provide access to different embeddings models
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import ollama  # type: ignore
 import openai
 
+from personal_graph.embeddings_cache import EmbeddingsCache
+
 
 class EmbeddingsModel(ABC):
     @abstractmethod
     def get_embedding(self, text: str) -> list[float]:
         pass
 
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        return [self.get_embedding(text) for text in texts]
+
+    async def aget_embedding(self, text: str) -> list[float]:
+        return await asyncio.to_thread(self.get_embedding, text)
+
+    async def aget_embeddings(self, texts: list[str]) -> list[list[float]]:
+        return await asyncio.to_thread(self.get_embeddings, texts)
+
 
 class OpenAIEmbeddingsModel(EmbeddingsModel):
+    # Number of inputs sent in a single embeddings request
+    batch_size: int = 512
+    # Number of embeddings requests in flight at once
+    concurrency: int = 32
+
     def __init__(
-        self, embed_client: openai.OpenAI, embed_model: str, embed_dimension: int = 384
+        self,
+        embed_client: openai.OpenAI,
+        embed_model: str,
+        embed_dimension: int = 384,
+        cache_size: int = 10000,
+        disk_cache: Optional[EmbeddingsCache] = None,
+        async_client: Optional[openai.AsyncOpenAI] = None,
     ) -> None:
         self.client = embed_client if embed_client else None
+        self.async_client = async_client
         self.model = embed_model
         self.dimension = embed_dimension
+        self.cache_size = cache_size
+        self.disk_cache = disk_cache
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
 
     def __repr__(self) -> str:
         return (
@@ -31,20 +61,144 @@ class OpenAIEmbeddingsModel(EmbeddingsModel):
             f"  )"
         )
 
+    def _cached_embedding(self, text: str) -> Optional[list[float]]:
+        embedding = self._cache.get(text)
+        if embedding is not None:
+            self._cache.move_to_end(text)
+        return embedding
+
+    def _cache_embedding(self, text: str, embedding: list[float]) -> None:
+        if self.cache_size <= 0:
+            return
+
+        self._cache[text] = embedding
+        self._cache.move_to_end(text)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _lookup(
+        self, texts: list[str]
+    ) -> Tuple[Dict[str, list[float]], list[str], Dict[str, str]]:
+        """Collect the cached embeddings and the texts that still need a request"""
+
+        # Only texts that are not cached yet are sent to the API, once each
+        embeddings: Dict[str, list[float]] = {}
+        missing: list[str] = []
+        for text in dict.fromkeys(texts):
+            embedding = self._cached_embedding(text)
+            if embedding is None:
+                missing.append(text)
+            else:
+                embeddings[text] = embedding
+
+        # Fall back to the embeddings persisted by previous runs
+        keys: Dict[str, str] = {}
+        if missing and self.disk_cache is not None:
+            keys = {
+                text: EmbeddingsCache.key(self.model, self.dimension, text)
+                for text in missing
+            }
+            stored = self.disk_cache.get_many(list(keys.values()))
+            for text, key in keys.items():
+                if key in stored:
+                    embeddings[text] = stored[key]
+                    self._cache_embedding(text, stored[key])
+            missing = [text for text in missing if text not in embeddings]
+
+        return embeddings, missing, keys
+
+    def _batches(self, texts: list[str]) -> list[list[str]]:
+        return [
+            texts[start : start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+
+    def _store(
+        self,
+        batch: list[str],
+        response: Any,
+        embeddings: Dict[str, list[float]],
+        keys: Dict[str, str],
+    ) -> None:
+        for item in response.data:
+            embeddings[batch[item.index]] = item.embedding
+            self._cache_embedding(batch[item.index], item.embedding)
+
+        if self.disk_cache is not None:
+            self.disk_cache.set_many({keys[text]: embeddings[text] for text in batch})
+
+    def _create(self, client: openai.OpenAI, batch: list[str]) -> Any:
+        return client.embeddings.create(
+            input=batch,
+            model=self.model,
+            dimensions=self.dimension,
+            encoding_format="float",
+        )
+
+    async def _afetch(
+        self, client: openai.AsyncOpenAI, batches: list[list[str]]
+    ) -> list[Any]:
+        """Send all batches on the async client, overlapping their round trips"""
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _create(batch: list[str]) -> Any:
+            async with semaphore:
+                return await client.embeddings.create(
+                    input=batch,
+                    model=self.model,
+                    dimensions=self.dimension,
+                    encoding_format="float",
+                )
+
+        return await asyncio.gather(*[_create(batch) for batch in batches])
+
     def get_embedding(self, text: str) -> list[float]:
         if self.client is None:
             return []
-        text = text.replace("\n", " ")
-        return (
-            self.client.embeddings.create(
-                input=[text],
-                model=self.model,
-                dimensions=self.dimension,
-                encoding_format="float",
-            )
-            .data[0]
-            .embedding
-        )
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        client = self.client
+        if client is None:
+            return [[] for _ in texts]
+
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings, missing, keys = self._lookup(texts)
+        batches = self._batches(missing)
+
+        # Overlap the round trips of the batches on the thread-safe sync client
+        if len(batches) > 1 and self.concurrency > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.concurrency, len(batches))
+            ) as executor:
+                responses = list(
+                    executor.map(lambda batch: self._create(client, batch), batches)
+                )
+        else:
+            responses = [self._create(client, batch) for batch in batches]
+
+        for batch, response in zip(batches, responses):
+            self._store(batch, response, embeddings, keys)
+
+        return [list(embeddings[text]) for text in texts]
+
+    async def aget_embedding(self, text: str) -> list[float]:
+        return (await self.aget_embeddings([text]))[0]
+
+    async def aget_embeddings(self, texts: list[str]) -> list[list[float]]:
+        async_client = self.async_client
+        if async_client is None:
+            return await super().aget_embeddings(texts)
+
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings, missing, keys = self._lookup(texts)
+        batches = self._batches(missing)
+
+        for batch, response in zip(batches, await self._afetch(async_client, batches)):
+            self._store(batch, response, embeddings, keys)
+
+        return [list(embeddings[text]) for text in texts]
 
 
 class OllamaEmbeddingModel(EmbeddingsModel):
@@ -0,0 +1,56 @@
+"""
+Persist embeddings on disk so they survive process restarts
+"""
+
+import array
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, List
+
+
+class EmbeddingsCache:
+    # SQLite limits the number of bound parameters in a single statement
+    max_variables: int = 500
+
+    def __init__(self, path: str = "~/.cache/pg-embeddings") -> None:
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._connection = sqlite3.connect(
+            self.path / "embeddings.db", check_same_thread=False
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+        )
+        self._connection.commit()
+
+    def __repr__(self) -> str:
+        return f"EmbeddingsCache(path='{self.path}')"
+
+    @staticmethod
+    def key(model: str, dimension: int, text: str) -> str:
+        return hashlib.sha256(f"{model}|{dimension}|{text}".encode()).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        embeddings: Dict[str, List[float]] = {}
+        for start in range(0, len(keys), self.max_variables):
+            chunk = keys[start : start + self.max_variables]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for key, blob in rows:
+                embeddings[key] = array.array("f", blob).tolist()
+        return embeddings
+
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, embedding) VALUES (?, ?)",
+            [
+                (key, array.array("f", embedding).tobytes())
+                for key, embedding in embeddings.items()
+            ],
+        )
+        self._connection.commit()
@@ -211,8 +211,23 @@ class GraphDB(AbstractContextManager):
             )
 
     def add_nodes(self, nodes: List[Node]) -> None:
+        added: List[Tuple[Node, Dict]] = []
         for node in nodes:
-            self.add_node(node)
+            if self.db.search_node(node_id=node.id) is None:
+                attributes = (
+                    json.loads(node.attributes)
+                    if isinstance(node.attributes, str)
+                    else node.attributes
+                )
+                self.db.add_node(node.label, attributes, node.id)
+                added.append((node, attributes))
+
+        # Embed every new node in one batch instead of one request per node
+        self.vector_store.add_node_embeddings(
+            [node.id for node, _ in added],
+            [node.label for node, _ in added],
+            [attributes for _, attributes in added],
+        )
 
     def add_edge(self, edge: EdgeInput) -> None:
         attributes = (
@@ -243,8 +258,28 @@ class GraphDB(AbstractContextManager):
             )
 
     def add_edges(self, edges: List[EdgeInput]) -> None:
+        added: List[Tuple[EdgeInput, Dict]] = []
         for edge in edges:
-            self.add_edge(edge)
+            attributes = (
+                json.loads(edge.attributes)
+                if isinstance(edge.attributes, str)
+                else edge.attributes
+            )
+            if (
+                self.db.search_edge(edge.source.id, edge.target.id, attributes) is None
+                and (self.db.search_node(edge.source.id) is not None)
+                and (self.db.search_node(edge.target.id) is not None)
+            ):
+                self.db.add_edge(edge.source.id, edge.target.id, edge.label, attributes)
+                added.append((edge, attributes))
+
+        # Embed every new edge in one batch instead of one request per edge
+        self.vector_store.add_edge_embeddings(
+            [edge.source.id for edge, _ in added],
+            [edge.target.id for edge, _ in added],
+            [edge.label for edge, _ in added],
+            [attributes for _, attributes in added],
+        )
 
     def update_node(self, node: Node) -> None:
         node_data = self.db.search_node(node.id)
@@ -278,8 +313,11 @@ class GraphDB(AbstractContextManager):
             self.vector_store.delete_edge_embedding(ids)
 
     def remove_nodes(self, ids: List[Any]) -> None:
-        for id in ids:
-            self.remove_node(id)
+        existing, node_embed_ids, edge_embed_ids = self.db.fetch_nodes_embed_ids(ids)
+
+        self.vector_store.delete_node_embeddings(node_embed_ids)
+        self.vector_store.delete_edge_embedding(edge_embed_ids)
+        self.db.remove_nodes(existing)
 
     def search_node(self, node_id: str | int) -> Any:
         return self.db.search_node(node_id)
@@ -527,6 +565,12 @@ class GraphDB(AbstractContextManager):
     def fetch_ids_from_db(self) -> List[str]:
         return self.db.fetch_ids_from_db()
 
+    def dump_all_nodes(self) -> List[Any]:
+        return self.db.dump_all_nodes()
+
+    def dump_all_edges(self) -> List[Any]:
+        return self.db.dump_all_edges()
+
     def search_indegree_edges(self, target: str) -> List[Any]:
         return self.db.search_indegree_edges(target)
 
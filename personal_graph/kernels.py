@@ -0,0 +1,105 @@
+"""
+Numeric kernels for vector scoring, compiled with numba when it is installed
+"""
+
+from types import ModuleType
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+numba: Optional[ModuleType]
+try:
+    import numba  # type: ignore
+except ImportError:
+    numba = None
+
+
+def _squared_l2_numpy(candidates: np.ndarray, query: np.ndarray) -> np.ndarray:
+    diff = candidates - query
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def _sq8_dot_numpy(codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+    # Accumulate in int32, int8 products overflow int8 immediately
+    return np.einsum("ij,j->i", codes, query, dtype=np.int32)
+
+
+_squared_l2: Any = _squared_l2_numpy
+_sq8_dot: Any = _sq8_dot_numpy
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _squared_l2_numba(candidates, query):
+        n, d = candidates.shape
+        distances = np.empty(n, dtype=np.float32)
+        for i in numba.prange(n):
+            total = np.float32(0.0)
+            for j in range(d):
+                diff = candidates[i, j] - query[j]
+                total += diff * diff
+            distances[i] = total
+        return distances
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _sq8_dot_numba(codes, query):
+        n, d = codes.shape
+        dots = np.empty(n, dtype=np.int32)
+        for i in numba.prange(n):
+            total = np.int32(0)
+            for j in range(d):
+                total += np.int32(codes[i, j]) * np.int32(query[j])
+            dots[i] = total
+        return dots
+
+    _squared_l2 = _squared_l2_numba
+    _sq8_dot = _sq8_dot_numba
+
+
+def _topk(distances: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    k = min(k, len(distances))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    top = np.argpartition(distances, k - 1)[:k]
+    top = top[np.argsort(distances[top], kind="stable")]
+    return top, distances[top]
+
+
+def l2_topk(candidates: Any, query: Any, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the positions of the k candidates nearest to the query and their
+    squared L2 distances, nearest first"""
+
+    candidates = np.ascontiguousarray(candidates, dtype=np.float32)
+    query = np.ascontiguousarray(query, dtype=np.float32)
+    if len(candidates) == 0:
+        return _topk(np.empty(0, dtype=np.float32), k)
+
+    return _topk(_squared_l2(candidates, query), k)
+
+
+def quantize_sq8(vectors: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Scale each vector into int8 by its largest absolute component, returning
+    the codes and the per-vector fp32 scales"""
+
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def sq8_l2_topk(
+    codes: np.ndarray, scales: np.ndarray, norms: np.ndarray, query: Any, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Approximate `l2_topk` over int8 codes, expanding the squared distance as
+    |q|^2 + |c|^2 - 2 q.c with the exact squared norms of the stored vectors"""
+
+    query = np.asarray(query, dtype=np.float32)
+    if len(codes) == 0:
+        return _topk(np.empty(0, dtype=np.float32), k)
+
+    query_codes, query_scale = quantize_sq8(query)
+    dots = _sq8_dot(codes, query_codes[0]).astype(np.float32)
+    distances = norms + np.dot(query, query) - 2 * dots * scales * query_scale[0]
+    return _topk(np.maximum(distances, 0), k)
@@ -1,4 +1,3 @@
-import json
 from typing import Dict, Any
 
 import networkx as nx  # type: ignore
@@ -7,6 +6,7 @@ from matplotlib import pyplot as plt
 
 from personal_graph import GraphDB
 from personal_graph import KnowledgeGraph, Node, Edge, EdgeInput
+from personal_graph.serialization import dumps, loads
 
 
 def pg_to_networkx(graph: GraphDB, *, post_visualize: bool = False):
@@ -15,37 +15,20 @@ def pg_to_networkx(graph: GraphDB, *, post_visualize: bool = False):
     """
     G = nx.Graph()  # Empty Graph with no nodes and edges
 
-    node_ids = graph.fetch_ids_from_db()
     # Add edges to networkX
-    for source_id in node_ids:
-        outdegree_edges = graph.search_outdegree_edges(source_id)
-        if outdegree_edges is []:
-            continue
+    for source_id, target_id, edge_label, edge_data in graph.dump_all_edges():
+        if isinstance(edge_data, str):
+            edge_data = loads(edge_data)
 
-        for target_id, edge_label, edge_data in outdegree_edges:
-            if isinstance(edge_data, str):
-                edge_data = json.loads(edge_data)
+        edge_data["label"] = edge_label
+        G.add_edge(source_id, target_id, **edge_data)
 
-            edge_data["label"] = edge_label
-            G.add_edge(source_id, target_id, **edge_data)
+    for node_id, node_label, node_data in graph.dump_all_nodes():
+        if isinstance(node_data, str):
+            node_data = loads(node_data)
 
-    for target_id in node_ids:
-        indegree_edges = graph.search_indegree_edges(target_id)
-
-        if indegree_edges is []:
-            continue
-
-        for source_id, edge_label, edge_data in indegree_edges:
-            if isinstance(edge_data, str):
-                edge_data = json.loads(edge_data)
-
-            edge_data["label"] = edge_label
-            G.add_edge(source_id, target_id, **edge_data)
-
-    for node_id in node_ids:
-        node_data = graph.search_node(node_id)
         if "label" not in node_data.keys():
-            node_data["label"] = graph.db.search_node_label(node_id)
+            node_data["label"] = node_label
 
         G.add_node(node_id, **node_data)
 
@@ -138,8 +121,8 @@ def networkx_to_pg(
             node_label: str = node_attributes.pop("label", "")
             node = Node(
                 id=str(node_id),
-                label=node_label[0],
-                attributes=json.dumps(node_attributes),
+                label=node_label if isinstance(node_label, str) else node_label[0],
+                attributes=dumps(node_attributes),
             )
 
             if not override:
@@ -154,11 +137,22 @@ def networkx_to_pg(
                 graph.add_node(node)
             kg.nodes.append(node)
 
+    # Look up edge endpoints in one dump instead of querying each endpoint
+    all_nodes: Dict[str, Any] = {
+        str(node_id): (
+            node_label,
+            loads(node_data) if isinstance(node_data, str) else node_data,
+        )
+        for node_id, node_label, node_data in graph.dump_all_nodes()
+    }
+
     for edge in kg.edges:
-        source_node_attributes = graph.search_node(edge.source)
-        source_node_label = graph.search_node_label(edge.source)
-        target_node_attributes = graph.search_node(edge.target)
-        target_node_label = graph.search_node_label(edge.target)
+        source_node_label, source_node_attributes = all_nodes.get(
+            str(edge.source), (None, None)
+        )
+        target_node_label, target_node_attributes = all_nodes.get(
+            str(edge.target), (None, None)
+        )
         final_edge_to_be_inserted = EdgeInput(
             source=Node(
                 id=edge.source,
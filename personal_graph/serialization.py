@@ -0,0 +1,52 @@
+"""
+JSON encoding for the hot paths, backed by orjson when it is installed
+"""
+
+import json
+import re
+from types import ModuleType
+from typing import Any, Optional, Union
+
+orjson: Optional[ModuleType]
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+# Runs of digits long enough to hold an integer beyond 64 bits, which orjson
+# would read back as a float
+_LONG_DIGITS = re.compile(r"\d{19,}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19,}")
+
+
+def _json_dumps(obj: Any) -> str:
+    # Same compact text as orjson, since the encoded text is what gets embedded
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def dumps(obj: Any) -> str:
+    if orjson is None:
+        return _json_dumps(obj)
+
+    try:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    except TypeError:
+        # orjson rejects what json accepts, such as integers beyond 64 bits
+        return _json_dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    if orjson is None:
+        return json.loads(data)
+
+    if isinstance(data, bytes):
+        long_digits = _LONG_DIGITS_BYTES.search(data) is not None
+    else:
+        long_digits = _LONG_DIGITS.search(data) is not None
+    if long_digits:
+        return json.loads(data)
+
+    return orjson.loads(data)
@@ -0,0 +1 @@
+with matches as (select json_extract(value, '$[0]') as rowid, json_extract(value, '$[1]') as distance from json_each(?)) select matches.rowid, edges.source, edges.target, edges.label, edges.attributes, matches.distance from matches join edges on edges.embed_id = matches.rowid ORDER BY distance DESC
\ No newline at end of file
@@ -0,0 +1,21 @@
+WITH matches AS (
+  SELECT
+    json_extract(value, '$[0]') AS rowid,
+    json_extract(value, '$[1]') AS distance
+  FROM json_each(?)
+)
+SELECT
+  matches.rowid,
+  nodes.id,
+  nodes.label,
+  nodes.attributes,
+  matches.distance
+FROM matches
+JOIN nodes ON nodes.embed_id = matches.rowid
+ORDER BY
+  CASE
+    WHEN ? != "" AND ? IS TRUE THEN json_extract(nodes.attributes, '$.' || ?) ELSE NULL
+  END DESC,
+  CASE
+    WHEN ? != "" AND ? IS FALSE THEN json_extract(nodes.attributes, '$.' || ?) ELSE NULL
+  END ASC;
@@ -0,0 +1,2 @@
+INSERT INTO relationship_embedding(rowid, vector_relations)
+SELECT COALESCE(MAX(rowid), 0) + 1, vector_from_raw(?) FROM relationship_embedding_data;
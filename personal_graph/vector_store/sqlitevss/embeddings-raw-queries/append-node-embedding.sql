@@ -0,0 +1,2 @@
+INSERT INTO nodes_embedding(rowid, vector_nodes)
+SELECT COALESCE(MAX(rowid), 0) + 1, vector_from_raw(?) FROM nodes_embedding_data;
@@ -1 +1 @@
-INSERT INTO relationship_embedding(rowid, vector_relations) VALUES(?, ?)
\ No newline at end of file
+INSERT INTO relationship_embedding(rowid, vector_relations) VALUES(?, vector_from_raw(?))
\ No newline at end of file
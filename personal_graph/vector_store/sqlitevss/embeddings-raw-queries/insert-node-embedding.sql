@@ -1 +1 @@
-INSERT INTO nodes_embedding(rowid, vector_nodes) VALUES (?,?);
\ No newline at end of file
+INSERT INTO nodes_embedding(rowid, vector_nodes) VALUES (?, vector_from_raw(?));
\ No newline at end of file
@@ -1 +1 @@
-SELECT rowid, distance FROM nodes_embedding WHERE vss_search(vector_nodes, vss_search_params(json(?), ?))
\ No newline at end of file
+SELECT rowid, distance FROM nodes_embedding WHERE vss_search(vector_nodes, vss_search_params(vector_from_raw(?), ?))
\ No newline at end of file
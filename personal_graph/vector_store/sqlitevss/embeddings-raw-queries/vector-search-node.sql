@@ -1,7 +1,7 @@
 WITH matches AS (
   SELECT rowid, distance
   FROM nodes_embedding
-  WHERE vss_search(vector_nodes, vss_search_params(json(?), ?))
+  WHERE vss_search(vector_nodes, vss_search_params(vector_from_raw(?), ?))
 )
 SELECT
   rowid,
@@ -0,0 +1,156 @@
+"""
+HNSW index kept alongside the sqlite-vss tables for sub-linear vector search
+"""
+
+from pathlib import Path
+from typing import Any, List, Optional, Set, Tuple
+
+import numpy as np
+
+from personal_graph.kernels import l2_topk
+
+try:
+    import hnswlib  # type: ignore
+except ImportError:
+    pass
+
+
+class HNSWIndex:
+    def __init__(
+        self,
+        path: str,
+        dimension: int,
+        *,
+        M: int = 16,
+        ef_construction: int = 200,
+        ef: int = 64,
+        initial_capacity: int = 1024,
+    ) -> None:
+        self.path = Path(path)
+        self.dimension = dimension
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef = ef
+        self.initial_capacity = initial_capacity
+        self._index: Any = None
+        # hnswlib keeps deleted elements around and cannot list them
+        self._deleted: Set[int] = set()
+
+    def __repr__(self) -> str:
+        return f"HNSWIndex(path='{self.path}', dimension={self.dimension})"
+
+    def __len__(self) -> int:
+        return self._load().get_current_count() - len(self._deleted)
+
+    @property
+    def _deleted_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".deleted.npy")
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _create(self) -> Any:
+        # Squared L2, the same distance sqlite-vss reports
+        index = hnswlib.Index(space="l2", dim=self.dimension)
+        index.init_index(
+            max_elements=self.initial_capacity,
+            ef_construction=self.ef_construction,
+            M=self.M,
+        )
+        index.set_ef(self.ef)
+        return index
+
+    def _load(self) -> Any:
+        if self._index is None:
+            if self.path.exists():
+                index = hnswlib.Index(space="l2", dim=self.dimension)
+                index.load_index(str(self.path))
+                index.set_ef(self.ef)
+                if self._deleted_path.exists():
+                    self._deleted = set(np.load(self._deleted_path).tolist())
+                self._index = index
+            else:
+                self._index = self._create()
+
+        return self._index
+
+    def max_id(self) -> int:
+        """Largest live id, 0 when the index is empty"""
+        ids = set(self._load().get_ids_list()) - self._deleted
+        return max(ids, default=0)
+
+    def has_vector(self, id: int, embedding: List[float]) -> bool:
+        """Whether the live element with this id holds the given vector"""
+        if id in self._deleted:
+            return False
+
+        try:
+            stored = self._load().get_items([id])
+        except RuntimeError:
+            return False
+        return bool(np.allclose(stored[0], embedding))
+
+    def reset(self) -> None:
+        """Drop every element, ignoring what was saved on disk"""
+        self._index = self._create()
+        self._deleted = set()
+
+    def add(self, ids: List[int], embeddings: List[List[float]]) -> None:
+        if not ids:
+            return
+
+        index = self._load()
+        required = index.get_current_count() + len(ids)
+        if required > index.get_max_elements():
+            index.resize_index(max(required, 2 * index.get_max_elements()))
+
+        # Re-adding a deleted id overwrites its vector and un-deletes it
+        index.add_items(embeddings, ids)
+        self._deleted.difference_update(ids)
+
+    def remove(self, ids: List[int]) -> None:
+        index = self._load()
+        for id in ids:
+            try:
+                index.mark_deleted(id)
+            except RuntimeError:
+                # Unknown or already deleted id
+                continue
+            self._deleted.add(id)
+
+    def _exact_query(self, embedding: List[float], k: int) -> List[Tuple[int, float]]:
+        """Score every live vector in the index exactly"""
+
+        index = self._load()
+        ids = [id for id in index.get_ids_list() if id not in self._deleted]
+        vectors = index.get_items(ids) if ids else []
+
+        positions, distances = l2_topk(vectors, embedding, k)
+        return [(ids[i], float(d)) for i, d in zip(positions, distances)]
+
+    def query(
+        self, embedding: List[float], k: int
+    ) -> Optional[List[Tuple[int, float]]]:
+        """Return up to k (id, distance) pairs, nearest first"""
+
+        index = self._load()
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+
+        try:
+            labels, distances = index.knn_query(embedding, k=k)
+        except RuntimeError:
+            # Fewer than k elements are reachable once deleted ones are skipped,
+            # which leaves a small enough candidate set to scan exactly
+            return self._exact_query(embedding, k)
+
+        return list(zip(labels[0].tolist(), distances[0].tolist()))
+
+    def save(self) -> None:
+        if self._index is None:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._index.save_index(str(self.path))
+        np.save(self._deleted_path, np.fromiter(self._deleted, dtype=np.int64))
@@ -0,0 +1,178 @@
+"""
+Flat int8 (SQ8) index kept alongside the sqlite-vss tables, a quarter the size of fp32
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from personal_graph.kernels import l2_topk, quantize_sq8, sq8_l2_topk
+
+
+class SQ8Index:
+    # Candidates taken from the int8 scan per requested result, before the exact
+    # fp32 rerank
+    oversample: int = 4
+
+    def __init__(
+        self, path: str, dimension: int, *, initial_capacity: int = 1024
+    ) -> None:
+        self.path = Path(path)
+        self.dimension = dimension
+        self.initial_capacity = initial_capacity
+        self._loaded = False
+        self._allocate(0)
+
+    def __repr__(self) -> str:
+        return f"SQ8Index(path='{self.path}', dimension={self.dimension})"
+
+    def __len__(self) -> int:
+        self._load()
+        return self._size
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _allocate(self, capacity: int) -> None:
+        # Rows past _size are spare capacity, so appends don't copy every time
+        self._size = 0
+        self._rows: Dict[int, int] = {}
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self._codes = np.empty((capacity, self.dimension), dtype=np.int8)
+        self._scales = np.empty(capacity, dtype=np.float32)
+        self._norms = np.empty(capacity, dtype=np.float32)
+
+    def _grow(self, required: int) -> None:
+        capacity = len(self._ids)
+        if required <= capacity:
+            return
+
+        capacity = max(required, 2 * capacity, self.initial_capacity)
+        self._ids = np.resize(self._ids, capacity)
+        self._codes = np.resize(self._codes, (capacity, self.dimension))
+        self._scales = np.resize(self._scales, capacity)
+        self._norms = np.resize(self._norms, capacity)
+
+    def max_id(self) -> int:
+        """Largest id, 0 when the index is empty"""
+        self._load()
+        return max(self._rows, default=0)
+
+    def has_vector(self, id: int, embedding: List[float]) -> bool:
+        """Whether the element with this id holds the given vector, up to its int8
+        codes"""
+        self._load()
+        row = self._rows.get(id)
+        if row is None:
+            return False
+
+        codes, scales = quantize_sq8(embedding)
+        return bool(
+            np.array_equal(self._codes[row], codes[0])
+            and np.isclose(self._scales[row], scales[0])
+        )
+
+    def reset(self) -> None:
+        """Drop every element, ignoring what was saved on disk"""
+        self._allocate(0)
+        self._loaded = True
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+
+        if self.path.exists():
+            with np.load(self.path) as stored:
+                self._ids = stored["ids"]
+                self._codes = stored["codes"]
+                self._scales = stored["scales"]
+                self._norms = stored["norms"]
+            self._size = len(self._ids)
+            self._rows = {int(id): row for row, id in enumerate(self._ids)}
+        self._loaded = True
+
+    def add(self, ids: List[int], embeddings: List[List[float]]) -> None:
+        if not ids:
+            return
+
+        self._load()
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        codes, scales = quantize_sq8(vectors)
+        norms = (vectors * vectors).sum(axis=1)
+
+        # Re-adding an id replaces its vector in place, new ids are appended
+        self._grow(self._size + len(ids))
+        rows = []
+        for id in ids:
+            row = self._rows.get(id)
+            if row is None:
+                row = self._rows[id] = self._size
+                self._size += 1
+            rows.append(row)
+
+        self._ids[rows] = ids
+        self._codes[rows] = codes
+        self._scales[rows] = scales
+        self._norms[rows] = norms
+
+    def remove(self, ids: List[int]) -> None:
+        self._load()
+        for id in ids:
+            row = self._rows.pop(id, None)
+            if row is None:
+                continue
+
+            # Fill the hole with the last row so the live rows stay contiguous
+            self._size -= 1
+            last = self._size
+            if row != last:
+                moved = int(self._ids[last])
+                self._ids[row] = moved
+                self._codes[row] = self._codes[last]
+                self._scales[row] = self._scales[last]
+                self._norms[row] = self._norms[last]
+                self._rows[moved] = row
+
+    def query(
+        self,
+        embedding: List[float],
+        k: int,
+        vectors: Optional[Callable[[List[int]], Any]] = None,
+    ) -> Optional[List[Tuple[int, float]]]:
+        """Return up to k (id, distance) pairs, nearest first.
+
+        With `vectors`, which returns the fp32 vectors of the given ids, the int8
+        scan only shortlists candidates and the distances are exact. Otherwise
+        they are the int8 approximations."""
+
+        self._load()
+        size = self._size
+        positions, distances = sq8_l2_topk(
+            self._codes[:size],
+            self._scales[:size],
+            self._norms[:size],
+            embedding,
+            k * self.oversample if vectors is not None else k,
+        )
+        ids = self._ids[positions].tolist()
+        if vectors is None or not ids:
+            return [(id, float(d)) for id, d in zip(ids, distances)]
+
+        positions, distances = l2_topk(vectors(ids), embedding, k)
+        return [(ids[i], float(d)) for i, d in zip(positions, distances)]
+
+    def save(self) -> None:
+        if not self._loaded:
+            return
+
+        size = self._size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as f:
+            np.savez(
+                f,
+                ids=self._ids[:size],
+                codes=self._codes[:size],
+                scales=self._scales[:size],
+                norms=self._norms[:size],
+            )
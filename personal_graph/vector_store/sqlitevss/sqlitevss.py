@@ -1,7 +1,9 @@
-import json
-from functools import lru_cache
+import array
+import os
 from pathlib import Path
-from typing import Any, Dict, Union, List
+from typing import Any, Dict, Optional, Tuple, Union, List
+
+import numpy as np
 
 from personal_graph.clients import (
     OpenAIEmbeddingClient,
@@ -9,17 +11,35 @@ from personal_graph.clients import (
     OllamaEmbeddingClient,
 )
 from personal_graph.vector_store.vector_store import VectorStore
+from personal_graph.vector_store.sqlitevss.hnsw import HNSWIndex
+from personal_graph.vector_store.sqlitevss.sq8 import SQ8Index
 from personal_graph.database import TursoDB
 from personal_graph.database import SQLite
 from personal_graph.database.db import CursorExecFunction
+from personal_graph.database.sqlite.sqlite import load_sql_dir
+from personal_graph.serialization import dumps
+
+SQL: Dict[str, str] = load_sql_dir(Path(__file__).parent / "embeddings-raw-queries")
+
+
+def serialize_f32(embedding: List[float]) -> bytes:
+    """Pack an embedding into the raw float32 format read by vector_from_raw"""
+    return array.array("f", embedding).tobytes()
+
 
+def filter_by_distance(
+    rows: List[Any], column: int, threshold: Optional[float], limit: int
+) -> List[Any]:
+    """Keep the first `limit` rows whose distance column is below the threshold,
+    preserving the order the rows were returned in"""
 
-@lru_cache(maxsize=None)
-def read_sql(sql_file: Path) -> str:
-    with open(
-        Path(__file__).parent.resolve() / "embeddings-raw-queries" / sql_file
-    ) as f:
-        return f.read()
+    if threshold is None:
+        return rows[:limit]
+
+    distances = np.fromiter(
+        (row[column] for row in rows), dtype=np.float64, count=len(rows)
+    )
+    return [rows[i] for i in np.flatnonzero(distances < threshold)[:limit]]
 
 
 class SQLiteVSS(VectorStore):
@@ -31,6 +51,8 @@ class SQLiteVSS(VectorStore):
         embedding_client: Union[
             OpenAIEmbeddingClient, LiteLLMEmbeddingClient, OllamaEmbeddingClient
         ] = OpenAIEmbeddingClient(),
+        hnsw_index_dir: Optional[str] = None,
+        quantized_index_dir: Optional[str] = None,
     ):
         self.db = db
         self.embedding_model = embedding_client.get_embedding_model()
@@ -39,17 +61,90 @@ class SQLiteVSS(VectorStore):
             raise ValueError("index_dimension cannot be None")
         self.index_dimension = index_dimension
 
+        if hnsw_index_dir is not None and quantized_index_dir is not None:
+            raise ValueError(
+                "hnsw_index_dir and quantized_index_dir cannot be used together"
+            )
+
+        # Optional HNSW or int8 indexes answering searches instead of the vss0 scan
+        self.hnsw_index_dir = hnsw_index_dir
+        self.quantized_index_dir = quantized_index_dir
+        self.node_index: Optional[Union[HNSWIndex, SQ8Index]] = None
+        self.edge_index: Optional[Union[HNSWIndex, SQ8Index]] = None
+        if hnsw_index_dir is not None:
+            self.node_index = HNSWIndex(
+                os.path.join(hnsw_index_dir, "nodes.bin"), index_dimension
+            )
+            self.edge_index = HNSWIndex(
+                os.path.join(hnsw_index_dir, "edges.bin"), index_dimension
+            )
+        elif quantized_index_dir is not None:
+            self.node_index = SQ8Index(
+                os.path.join(quantized_index_dir, "nodes.npz"), index_dimension
+            )
+            self.edge_index = SQ8Index(
+                os.path.join(quantized_index_dir, "edges.npz"), index_dimension
+            )
+
     def initialize(self):
         def _init(cursor, connection):
-            vector_schema = read_sql(Path("vector-store-schema.sql"))
+            vector_schema = SQL["vector-store-schema.sql"]
             vector_schema = vector_schema.replace("{{size}}", str(self.index_dimension))
 
             connection.executescript(vector_schema)
             connection.commit()
 
+            # Rebuild indexes that are missing or were not saved after the last
+            # change to their table
+            for index, table, column in (
+                (self.node_index, "nodes_embedding", "vector_nodes"),
+                (self.edge_index, "relationship_embedding", "vector_relations"),
+            ):
+                if index is None:
+                    continue
+
+                if self._index_is_current(cursor, index, table, column):
+                    continue
+
+                index.reset()
+                rows = cursor.execute(
+                    f"SELECT rowid, vector_to_raw({column}) FROM {table}"
+                ).fetchall()
+                index.add(
+                    [row[0] for row in rows],
+                    [array.array("f", row[1]).tolist() for row in rows],
+                )
+
         return self.db.atomic(_init)
 
+    def _index_is_current(
+        self,
+        cursor: Any,
+        index: Union[HNSWIndex, SQ8Index],
+        table: str,
+        column: str,
+    ) -> bool:
+        count, max_rowid = cursor.execute(
+            f"SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM {table}_data"
+        ).fetchone()
+        if not index.exists() or len(index) != count or index.max_id() != max_rowid:
+            return False
+        if max_rowid == 0:
+            return True
+
+        # Appends take MAX(rowid) + 1, so a write after the last save changes the
+        # count or the largest rowid, or reuses the largest rowid for a new vector
+        (raw,) = cursor.execute(
+            f"SELECT vector_to_raw({column}) FROM {table} WHERE rowid = ?",
+            (max_rowid,),
+        ).fetchone()
+        return index.has_vector(max_rowid, array.array("f", raw).tolist())
+
     def save(self):
+        if self.node_index is not None:
+            self.node_index.save()
+        if self.edge_index is not None:
+            self.edge_index.save()
         return self.db.save()
 
     def __repr__(self) -> str:
@@ -70,80 +165,122 @@ class SQLiteVSS(VectorStore):
         def _insert(cursor, connection):
             set_data = self._set_id(id, label, data)
 
-            count = (
-                cursor.execute(
-                    "SELECT COALESCE(MAX(rowid), 0) FROM nodes_embedding"
-                ).fetchone()[0]
-                + 1
-            )
-
+            # The rowid is computed by the insert itself, from the vss0 shadow table
+            embedding = self.embedding_model.get_embedding(dumps(set_data))
             cursor.execute(
-                read_sql(Path("insert-node-embedding.sql")),
-                (
-                    count,
-                    json.dumps(
-                        self.embedding_model.get_embedding(json.dumps(set_data))
-                    ),
-                ),
+                SQL["append-node-embedding.sql"],
+                (serialize_f32(embedding),),
             )
+            rowid = cursor.lastrowid
             connection.commit()
 
+            if self.node_index is not None:
+                self.node_index.add([rowid], [embedding])
+
         return _insert
 
     def _add_embeddings(self, nodes: List[Dict], labels: List[str], ids: List[Any]):
         def insert_nodes_embeddings(cursor, connection):
+            # MAX(rowid) of the shadow table is a b-tree lookup, unlike the vss0 scan
             count = (
                 cursor.execute(
-                    "SELECT COALESCE(MAX(rowid), 0) FROM nodes_embedding"
+                    "SELECT COALESCE(MAX(rowid), 0) FROM nodes_embedding_data"
                 ).fetchone()[0]
                 + 1
             )
 
-            for i, x in enumerate(zip(ids, labels, nodes)):
-                cursor.execute(
-                    read_sql(Path("insert-node-embedding.sql")),
-                    (
-                        count + i,
-                        json.dumps(
-                            self.embedding_model.get_embedding(
-                                json.dumps(self._set_id(x[0], x[1], x[2]))
-                            )
-                        ),
-                    ),
+            texts = [
+                dumps(self._set_id(id, label, node))
+                for id, label, node in zip(ids, labels, nodes)
+            ]
+            embeddings = self.embedding_model.get_embeddings(texts)
+
+            cursor.executemany(
+                SQL["insert-node-embedding.sql"],
+                [
+                    (count + i, serialize_f32(embedding))
+                    for i, embedding in enumerate(embeddings)
+                ],
+            )
+
+            if self.node_index is not None:
+                self.node_index.add(
+                    list(range(count, count + len(embeddings))), embeddings
                 )
 
         return insert_nodes_embeddings
 
     def _add_edge_embedding(self, data: Dict):
         def _insert_edge_embedding(cursor, connection):
+            embedding = self.embedding_model.get_embedding(dumps(data))
+            cursor.execute(
+                SQL["append-edge-embedding.sql"],
+                (serialize_f32(embedding),),
+            )
+            rowid = cursor.lastrowid
+            connection.commit()
+
+            if self.edge_index is not None:
+                self.edge_index.add([rowid], [embedding])
+
+        return _insert_edge_embedding
+
+    def _add_edge_embeddings(self, edges: List[Dict]):
+        def _insert_edge_embeddings(cursor, connection):
             count = (
                 cursor.execute(
-                    "SELECT COALESCE(MAX(rowid), 0) FROM relationship_embedding"
+                    "SELECT COALESCE(MAX(rowid), 0) FROM relationship_embedding_data"
                 ).fetchone()[0]
                 + 1
             )
 
-            cursor.execute(
-                read_sql(Path("insert-edge-embedding.sql")),
-                (
-                    count,
-                    json.dumps(self.embedding_model.get_embedding(json.dumps(data))),
-                ),
+            embeddings = self.embedding_model.get_embeddings(
+                [dumps(data) for data in edges]
             )
-            connection.commit()
 
-        return _insert_edge_embedding
+            cursor.executemany(
+                SQL["insert-edge-embedding.sql"],
+                [
+                    (count + i, serialize_f32(embedding))
+                    for i, embedding in enumerate(embeddings)
+                ],
+            )
+
+            if self.edge_index is not None:
+                self.edge_index.add(
+                    list(range(count, count + len(embeddings))), embeddings
+                )
+
+        return _insert_edge_embeddings
 
     def _remove_node(self, id: Any):
         def _delete_node_embedding(cursor, connection):
-            cursor.execute(read_sql(Path("delete-node-embedding.sql")), (id[0],))
+            cursor.execute(SQL["delete-node-embedding.sql"], (id[0],))
+
+            if self.node_index is not None:
+                self.node_index.remove([id[0]])
 
         return _delete_node_embedding
 
+    def _remove_nodes(self, ids: Any):
+        def _delete_node_embeddings(cursor, connection):
+            cursor.executemany(
+                SQL["delete-node-embedding.sql"], [(id[0],) for id in ids]
+            )
+
+            if self.node_index is not None:
+                self.node_index.remove([id[0] for id in ids])
+
+        return _delete_node_embeddings
+
     def _remove_edge(self, ids: Any):
         def _delete_node_embedding(cursor, connection):
-            for id in ids:
-                cursor.execute(read_sql(Path("delete-edge-embedding.sql")), (id[0],))
+            cursor.executemany(
+                SQL["delete-edge-embedding.sql"], [(id[0],) for id in ids]
+            )
+
+            if self.edge_index is not None:
+                self.edge_index.remove([id[0] for id in ids])
 
         return _delete_node_embedding
 
@@ -152,6 +289,14 @@ class SQLiteVSS(VectorStore):
     ) -> None:
         self.db.atomic(self._add_embedding(id, label, attribute))
 
+    def add_node_embeddings(
+        self, ids: List[Any], labels: List[str], attributes: List[Dict]
+    ) -> None:
+        if not ids:
+            return
+
+        self.db.atomic(self._add_embeddings(attributes, labels, ids))
+
     def add_edge_embedding(
         self, source: Any, target: Any, label: str, attributes: Dict
     ) -> None:
@@ -159,27 +304,64 @@ class SQLiteVSS(VectorStore):
             "source_id": source,
             "target_id": target,
             "label": label,
-            "attributes": json.dumps(attributes),
+            "attributes": dumps(attributes),
         }
 
         self.db.atomic(self._add_edge_embedding(edge_data))
 
     def add_edge_embeddings(self, sources, targets, labels, attributes):
-        for i, x in enumerate(zip(sources, targets, labels, attributes)):
-            edge_data = {
-                "source_id": x[0],
-                "target_id": x[1],
-                "label": x[2],
-                "attributes": json.dumps(x[3]),
+        edges = [
+            {
+                "source_id": source,
+                "target_id": target,
+                "label": label,
+                "attributes": dumps(attribute),
             }
-            self.db.atomic(self._add_edge_embedding(edge_data))
+            for source, target, label, attribute in zip(
+                sources, targets, labels, attributes
+            )
+        ]
+        if not edges:
+            return
+
+        self.db.atomic(self._add_edge_embeddings(edges))
 
     def delete_node_embedding(self, id: Any) -> None:
         self.db.atomic(self._remove_node(id))
 
+    def delete_node_embeddings(self, ids: Any) -> None:
+        self.db.atomic(self._remove_nodes(ids))
+
     def delete_edge_embedding(self, ids: Any) -> None:
         self.db.atomic(self._remove_edge(ids))
 
+    def _query_index(
+        self,
+        cursor: Any,
+        index: Optional[Union[HNSWIndex, SQ8Index]],
+        table: str,
+        column: str,
+        embedding: List[float],
+        limit: int,
+    ) -> Optional[List[Tuple[int, float]]]:
+        if index is None:
+            return None
+        if isinstance(index, HNSWIndex):
+            return index.query(embedding, limit)
+
+        def _vectors(ids: List[int]) -> List[array.array]:
+            # Rerank the int8 shortlist on the fp32 vectors kept by vss0
+            rows = dict(
+                cursor.execute(
+                    f"SELECT rowid, vector_to_raw({column}) FROM {table} "
+                    "WHERE rowid IN (SELECT value FROM json_each(?))",
+                    (dumps(ids),),
+                ).fetchall()
+            )
+            return [array.array("f", rows[id]) for id in ids]
+
+        return index.query(embedding, limit, _vectors)
+
     def vector_search_node(
         self,
         data: Dict,
@@ -190,31 +372,32 @@ class SQLiteVSS(VectorStore):
         sort_by: str = "",
     ):
         def _search_node(cursor, connection):
-            embed_json = json.dumps(
-                self.embedding_model.get_embedding(json.dumps(data))
+            embedding = self.embedding_model.get_embedding(dumps(data))
+            ordering = (sort_by, descending, sort_by, sort_by, descending, sort_by)
+
+            matches = self._query_index(
+                cursor,
+                self.node_index,
+                "nodes_embedding",
+                "vector_nodes",
+                embedding,
+                limit,
             )
-
-            nodes = cursor.execute(
-                read_sql(Path("vector-search-node.sql")),
-                (
-                    embed_json,
-                    limit,
-                    sort_by,
-                    descending,
-                    sort_by,
-                    sort_by,
-                    descending,
-                    sort_by,
-                ),
-            ).fetchall()
+            if matches is not None:
+                nodes = cursor.execute(
+                    SQL["ann-search-node.sql"],
+                    (dumps(matches), *ordering),
+                ).fetchall()
+            else:
+                nodes = cursor.execute(
+                    SQL["vector-search-node.sql"],
+                    (serialize_f32(embedding), limit, *ordering),
+                ).fetchall()
 
             if not nodes:
                 return None
 
-            if threshold is not None:
-                return [node for node in nodes if node[4] < threshold][:limit]
-            else:
-                return nodes[:limit]
+            return filter_by_distance(nodes, 4, threshold, limit)
 
         return self.db.atomic(_search_node)
 
@@ -230,25 +413,36 @@ class SQLiteVSS(VectorStore):
         sort_by: str = "",
     ):
         def _search_edge(cursor, connection):
-            embed = json.dumps(self.embedding_model.get_embedding(json.dumps(data)))
-            if descending:
+            embedding = self.embedding_model.get_embedding(dumps(data))
+
+            matches = self._query_index(
+                cursor,
+                self.edge_index,
+                "relationship_embedding",
+                "vector_relations",
+                embedding,
+                limit,
+            )
+            if matches is not None:
+                sql_file = (
+                    "ann-search-edge-desc.sql" if descending else "ann-search-edge.sql"
+                )
+                edges = cursor.execute(SQL[sql_file], (dumps(matches),)).fetchall()
+            elif descending:
                 edges = cursor.execute(
-                    read_sql(Path("vector-search-edge-desc.sql")), (embed, limit)
+                    SQL["vector-search-edge-desc.sql"],
+                    (serialize_f32(embedding), limit),
                 ).fetchall()
-
             else:
                 edges = cursor.execute(
-                    read_sql(Path("vector-search-edge.sql")), (embed, limit)
+                    SQL["vector-search-edge.sql"],
+                    (serialize_f32(embedding), limit),
                 ).fetchall()
 
             if not edges:
                 return None
 
-            if threshold is not None:
-                filtered_results = [edge for edge in edges if edge[5] < threshold]
-                return filtered_results[:limit]
-            else:
-                return edges[:limit]
+            return filter_by_distance(edges, 5, threshold, limit)
 
         return self.db.atomic(_search_edge)
 
@@ -256,22 +450,26 @@ class SQLiteVSS(VectorStore):
         self, data: Dict, *, threshold: float = 0.9, limit: int = 1
     ):
         def _search_node(cursor, connection):
-            embed_json = json.dumps(
-                self.embedding_model.get_embedding(json.dumps(data))
+            embedding = self.embedding_model.get_embedding(dumps(data))
+
+            nodes = self._query_index(
+                cursor,
+                self.node_index,
+                "nodes_embedding",
+                "vector_nodes",
+                embedding,
+                limit,
             )
-
-            nodes = cursor.execute(
-                read_sql(Path("similarity-search-node.sql")),
-                (embed_json, limit),
-            ).fetchall()
+            if nodes is None:
+                nodes = cursor.execute(
+                    SQL["similarity-search-node.sql"],
+                    (serialize_f32(embedding), limit),
+                ).fetchall()
 
             if not nodes:
                 return None
 
-            if threshold is not None:
-                return [node for node in nodes if node[1] < threshold][:limit]
-            else:
-                return nodes[:limit]
+            return filter_by_distance(nodes, 1, threshold, limit)
 
         return self.db.atomic(_search_node)
 
@@ -279,21 +477,25 @@ class SQLiteVSS(VectorStore):
         self, data: Dict, *, threshold: float = 0.9, limit: int = 1
     ):
         def _search_node(cursor, connection):
-            embed_json = json.dumps(
-                self.embedding_model.get_embedding(json.dumps(data))
+            embedding = self.embedding_model.get_embedding(dumps(data))
+
+            nodes = self._query_index(
+                cursor,
+                self.edge_index,
+                "relationship_embedding",
+                "vector_relations",
+                embedding,
+                limit,
             )
-
-            nodes = cursor.execute(
-                read_sql(Path("similarity-search-edge.sql")),
-                (embed_json, limit),
-            ).fetchall()
+            if nodes is None:
+                nodes = cursor.execute(
+                    SQL["similarity-search-edge.sql"],
+                    (serialize_f32(embedding), limit),
+                ).fetchall()
 
             if not nodes:
                 return None
 
-            if threshold is not None:
-                return [node for node in nodes if node[1] < threshold][:limit]
-            else:
-                return nodes[:limit]
+            return filter_by_distance(nodes, 1, threshold, limit)
 
         return self.db.atomic(_search_node)
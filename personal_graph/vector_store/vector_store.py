@@ -22,6 +22,13 @@ class VectorStore(ABC):
         """Add a single node embedding to the database."""
         pass
 
+    @abstractmethod
+    def add_node_embeddings(
+        self, ids: List[Any], labels: List[str], attributes: List[Dict]
+    ) -> None:
+        """Add nodes embeddings to the vector store"""
+        pass
+
     @abstractmethod
     def add_edge_embedding(
         self, source: Any, target: Any, label: str, attributes: Dict
@@ -45,6 +52,11 @@ class VectorStore(ABC):
         """Remove a single node embedding from the database."""
         pass
 
+    @abstractmethod
+    def delete_node_embeddings(self, ids: Any) -> None:
+        """Remove multiple node embeddings from the database."""
+        pass
+
     @abstractmethod
     def delete_edge_embedding(self, ids: Any) -> None:
         """Remove multiple nodes embedding from the database."""
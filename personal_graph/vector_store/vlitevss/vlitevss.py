@@ -36,6 +36,12 @@ class VliteVSS(VectorStore):
         )
         self.vlite.save()
 
+    def add_node_embeddings(
+        self, ids: List[Any], labels: List[str], attributes: List[Dict]
+    ) -> None:
+        for id, label, attribute in zip(ids, labels, attributes):
+            self.add_node_embedding(id, label, attribute)
+
     def add_edge_embedding(
         self, source: Any, target: Any, label: str, attributes: Dict
     ) -> None:
@@ -61,6 +67,10 @@ class VliteVSS(VectorStore):
             id_to_be_deleted = self.vlite.get(where={"embed_id": id})
             self.vlite.delete(id_to_be_deleted)
 
+    def delete_node_embeddings(self, ids: Any) -> None:
+        for id in ids:
+            self.delete_node_embedding(id)
+
     def delete_edge_embedding(self, ids: Any) -> None:
         id_to_be_deleted = self.vlite.get(where={"embed_id": id})
         self.vlite.delete(id_to_be_deleted)
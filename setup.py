@@ -27,6 +27,8 @@ setup(
         "dspy-ai>=2.3.0",
         "instructor>=1.2.2",
         "vlite>=0.2.7",
+        "numpy>=1.26.4",
+        "httpx>=0.27.0",
     ],
     extras_require={
         "dev": [
@@ -36,6 +38,10 @@ setup(
         ],
         "scrollable-textbox": ["streamlit-scrollable-textbox"],
         "turso": ["libsql-experimental"],
+        "hnsw": ["hnswlib"],
+        "orjson": ["orjson"],
+        "numba": ["numba"],
+        "http2": ["h2"],
     },
     python_requires=">=3.11",
 )
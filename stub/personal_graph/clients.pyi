@@ -1,6 +1,7 @@
 import abc
 from abc import ABC
 from dataclasses import dataclass
+from typing import Optional
 
 class APIClient(ABC, metaclass=abc.ABCMeta): ...
 
@@ -9,9 +10,11 @@ class LiteLLMEmbeddingClient(APIClient):
     model_name: str = ...
     dimensions: int = ...
     base_url: str = ...
+    cache_dir: Optional[str] = ...
     client = ...
+    async_client = ...
     def __post_init__(self) -> None: ...
-    def __init__(self, model_name, dimensions, base_url) -> None: ...
+    def __init__(self, model_name, dimensions, base_url, cache_dir) -> None: ...
 
 @dataclass
 class OpenAILLMClient(APIClient):
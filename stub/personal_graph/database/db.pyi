@@ -2,7 +2,7 @@ import abc
 from abc import ABC, abstractmethod
 from graphviz import Digraph  # type: ignore
 from personal_graph.models import Edge as Edge, Node as Node
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from personal_graph.database.db import CursorExecFunction
 
 class DB(ABC, metaclass=abc.ABCMeta):
@@ -17,6 +17,10 @@ class DB(ABC, metaclass=abc.ABCMeta):
     @abstractmethod
     def fetch_edge_embed_ids(self, id: Any): ...
     @abstractmethod
+    def fetch_nodes_embed_ids(
+        self, ids: List[Any]
+    ) -> Tuple[List[Any], List[Any], List[Any]]: ...
+    @abstractmethod
     def all_connected_nodes(self, node_or_edge: Node | Edge) -> Any: ...
     @abstractmethod
     def get_connections(self, identifier: Any) -> CursorExecFunction: ...
@@ -33,6 +37,8 @@ class DB(ABC, metaclass=abc.ABCMeta):
     @abstractmethod
     def remove_node(self, id: Any) -> None: ...
     @abstractmethod
+    def remove_nodes(self, ids: List[Any]) -> None: ...
+    @abstractmethod
     def search_node(self, node_id: Any) -> Any: ...
     @abstractmethod
     def search_node_label(self, node_id: Any) -> Any: ...
@@ -61,6 +67,10 @@ class DB(ABC, metaclass=abc.ABCMeta):
     @abstractmethod
     def fetch_ids_from_db(self) -> List[str]: ...
     @abstractmethod
+    def dump_all_nodes(self) -> List[Any]: ...
+    @abstractmethod
+    def dump_all_edges(self) -> List[Any]: ...
+    @abstractmethod
     def search_indegree_edges(self, target: Any) -> List[Any]: ...
     @abstractmethod
     def search_outdegree_edges(self, source: Any) -> List[Any]: ...
@@ -0,0 +1,12 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+class ConnectionPool:
+    max_size: int
+    def __init__(self, connect: Callable[[], Any], *, max_size: int = ...) -> None: ...
+    def get(self) -> Any: ...
+    def put(self, connection: Any) -> None: ...
+    @contextmanager
+    def acquire(self) -> Iterator[Any]: ...
+    def discard(self, connection: Any) -> None: ...
+    def close(self) -> None: ...
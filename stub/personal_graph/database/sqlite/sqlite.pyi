@@ -9,6 +9,11 @@ from typing import Any, Callable, Dict, List, Tuple, Optional
 CursorExecFunction = Callable[[sqlite3.Cursor, sqlite3.Connection], Any]
 
 def read_sql(sql_file: Path) -> str: ...
+def load_sql_dir(path: Path) -> Dict[str, str]: ...
+
+SQL: Dict[str, str]
+
+def render_template(template: Template, **kwargs: Any) -> str: ...
 
 class SqlTemplateLoader(BaseLoader):
     templates_dir: Path
@@ -18,6 +23,7 @@ class SqlTemplateLoader(BaseLoader):
     ) -> Tuple[str, str, Callable[[], bool]]: ...
 
 class SQLite(DB):
+    remove_batch_size: int
     use_in_memory: bool
     vector0_so_path: Optional[str]
     vss0_so_path: Optional[str]
@@ -44,6 +50,9 @@ class SQLite(DB):
     def get_connections(self, identifier: Any) -> CursorExecFunction: ...
     def fetch_node_embed_id(self, node_id: Any, limit: int = 1) -> None: ...
     def fetch_edge_embed_ids(self, id: Any, limit: int = 10): ...
+    def fetch_nodes_embed_ids(
+        self, ids: List[Any]
+    ) -> Tuple[List[Any], List[Any], List[Any]]: ...
     def search_edge(
         self, source: Any, target: Any, attributes: Dict, limit: int = 1
     ) -> Dict[Any, Any]: ...
@@ -53,6 +62,7 @@ class SQLite(DB):
     ) -> None: ...
     def update_node(self, node: Node): ...
     def remove_node(self, id: Any) -> None: ...
+    def remove_nodes(self, ids: List[Any]) -> None: ...
     def search_node(self, node_id: Any) -> Any: ...
     def search_node_label(self, node_id: Any, limit: int | None = 1) -> Any: ...
     def traverse(
@@ -74,6 +84,8 @@ class SQLite(DB):
         edge_kv: str = " ",
     ) -> Digraph: ...
     def fetch_ids_from_db(self, limit: int | None = 10) -> List[str]: ...
+    def dump_all_nodes(self) -> List[Any]: ...
+    def dump_all_edges(self) -> List[Any]: ...
     def search_indegree_edges(
         self, target: Any, limit: int | None = 10
     ) -> List[Any]: ...
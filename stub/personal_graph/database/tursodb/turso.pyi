@@ -4,6 +4,7 @@ from pathlib import Path
 from personal_graph.database.sqlite.sqlite import SQLite as SQLite
 from typing import Any, Callable, Tuple, Optional
 from personal_graph.database.db import CursorExecFunction
+from personal_graph.database.pool import ConnectionPool as ConnectionPool
 
 def read_sql(sql_file: Path) -> str: ...
 
@@ -17,12 +18,17 @@ class SqlTemplateLoader(BaseLoader):
 class TursoDB(SQLite):
     db_url: Optional[str]
     db_auth_token: Optional[str]
+    pool: ConnectionPool
     env: Environment
     clause_template: Template
     search_template: Template
     traverse_template: Template
     def __init__(
-        self, *, url: str | None = None, auth_token: str | None = None
+        self,
+        *,
+        url: str | None = None,
+        auth_token: str | None = None,
+        pool_size: int = ...,
     ) -> None: ...
     def __eq__(self, other): ...
     def atomic(self, cursor_exec_fn: CursorExecFunction) -> Any: ...
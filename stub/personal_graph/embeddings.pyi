@@ -2,16 +2,35 @@ import abc
 import openai
 from _typeshed import Incomplete
 from abc import ABC, abstractmethod
+from typing import Optional
+from personal_graph.embeddings_cache import EmbeddingsCache as EmbeddingsCache
 
 class EmbeddingsModel(ABC, metaclass=abc.ABCMeta):
     @abstractmethod
     def get_embedding(self, text: str) -> list[float]: ...
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]: ...
+    async def aget_embedding(self, text: str) -> list[float]: ...
+    async def aget_embeddings(self, texts: list[str]) -> list[list[float]]: ...
 
 class OpenAIEmbeddingsModel(EmbeddingsModel):
+    batch_size: int
+    concurrency: int
     client: Incomplete
     model: Incomplete
     dimension: Incomplete
+    cache_size: int
+    disk_cache: Optional[EmbeddingsCache]
+    async_client: Optional[openai.AsyncOpenAI]
     def __init__(
-        self, embed_client: openai.OpenAI, embed_model: str, embed_dimension: int
+        self,
+        embed_client: openai.OpenAI,
+        embed_model: str,
+        embed_dimension: int = ...,
+        cache_size: int = ...,
+        disk_cache: Optional[EmbeddingsCache] = ...,
+        async_client: Optional[openai.AsyncOpenAI] = ...,
     ) -> None: ...
     def get_embedding(self, text: str) -> list[float]: ...
+    def get_embeddings(self, texts: list[str]) -> list[list[float]]: ...
+    async def aget_embedding(self, text: str) -> list[float]: ...
+    async def aget_embeddings(self, texts: list[str]) -> list[list[float]]: ...
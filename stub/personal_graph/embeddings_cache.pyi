@@ -0,0 +1,11 @@
+from pathlib import Path
+from typing import Dict, List
+
+class EmbeddingsCache:
+    max_variables: int
+    path: Path
+    def __init__(self, path: str = ...) -> None: ...
+    @staticmethod
+    def key(model: str, dimension: int, text: str) -> str: ...
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]: ...
+    def set_many(self, embeddings: Dict[str, List[float]]) -> None: ...
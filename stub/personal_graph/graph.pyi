@@ -67,6 +67,8 @@ class GraphDB(AbstractContextManager):
     def find_nodes_like(self, label: str, *, threshold: float = 0.9) -> List[Node]: ...
     def visualize(self, file: str, id: List[str]) -> Digraph: ...
     def fetch_ids_from_db(self) -> List[str]: ...
+    def dump_all_nodes(self) -> List[Any]: ...
+    def dump_all_edges(self) -> List[Any]: ...
     def search_indegree_edges(self, target: str) -> List[Any]: ...
     def search_outdegree_edges(self, source: str) -> List[Any]: ...
     def is_unique_prompt(self, text: str, *, threshold: float = 0.9) -> bool: ...
@@ -0,0 +1,8 @@
+import numpy as np
+from typing import Any, Tuple
+
+def l2_topk(candidates: Any, query: Any, k: int) -> Tuple[np.ndarray, np.ndarray]: ...
+def quantize_sq8(vectors: Any) -> Tuple[np.ndarray, np.ndarray]: ...
+def sq8_l2_topk(
+    codes: np.ndarray, scales: np.ndarray, norms: np.ndarray, query: Any, k: int
+) -> Tuple[np.ndarray, np.ndarray]: ...
@@ -0,0 +1,4 @@
+from typing import Any, Union
+
+def dumps(obj: Any) -> str: ...
+def loads(data: Union[str, bytes]) -> Any: ...
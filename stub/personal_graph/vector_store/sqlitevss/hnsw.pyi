@@ -0,0 +1,31 @@
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+class HNSWIndex:
+    path: Path
+    dimension: int
+    M: int
+    ef_construction: int
+    ef: int
+    initial_capacity: int
+    def __init__(
+        self,
+        path: str,
+        dimension: int,
+        *,
+        M: int = ...,
+        ef_construction: int = ...,
+        ef: int = ...,
+        initial_capacity: int = ...,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def exists(self) -> bool: ...
+    def max_id(self) -> int: ...
+    def has_vector(self, id: int, embedding: List[float]) -> bool: ...
+    def reset(self) -> None: ...
+    def add(self, ids: List[int], embeddings: List[List[float]]) -> None: ...
+    def remove(self, ids: List[int]) -> None: ...
+    def query(
+        self, embedding: List[float], k: int
+    ) -> Optional[List[Tuple[int, float]]]: ...
+    def save(self) -> None: ...
@@ -0,0 +1,25 @@
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+class SQ8Index:
+    oversample: int
+    path: Path
+    dimension: int
+    initial_capacity: int
+    def __init__(
+        self, path: str, dimension: int, *, initial_capacity: int = 1024
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def exists(self) -> bool: ...
+    def max_id(self) -> int: ...
+    def has_vector(self, id: int, embedding: List[float]) -> bool: ...
+    def reset(self) -> None: ...
+    def add(self, ids: List[int], embeddings: List[List[float]]) -> None: ...
+    def remove(self, ids: List[int]) -> None: ...
+    def query(
+        self,
+        embedding: List[float],
+        k: int,
+        vectors: Optional[Callable[[List[int]], Any]] = None,
+    ) -> Optional[List[Tuple[int, float]]]: ...
+    def save(self) -> None: ...
@@ -1,4 +1,3 @@
-from pathlib import Path
 from personal_graph.clients import LiteLLMEmbeddingClient as LiteLLMEmbeddingClient
 from personal_graph.embeddings import OpenAIEmbeddingsModel as OpenAIEmbeddingsModel
 from personal_graph.database import SQLite as SQLite
@@ -6,26 +5,48 @@ from personal_graph.database import TursoDB as TursoDB
 from personal_graph.vector_store import (
     VectorStore as VectorStore,
 )
-from typing import Any, Dict, Union
+from personal_graph.vector_store.sqlitevss.hnsw import HNSWIndex as HNSWIndex
+from personal_graph.vector_store.sqlitevss.sq8 import SQ8Index as SQ8Index
+from typing import Any, Dict, List, Optional, Union
 
-def read_sql(sql_file: Path) -> str: ...
+SQL: Dict[str, str]
+
+def serialize_f32(embedding: list[float]) -> bytes: ...
+def filter_by_distance(
+    rows: List[Any], column: int, threshold: Optional[float], limit: int
+) -> List[Any]: ...
 
 class SQLiteVSS(VectorStore):
     db: Union[TursoDB, SQLite]
     embedding_model: LiteLLMEmbeddingClient
+    index_dimension: int
+    hnsw_index_dir: Optional[str]
+    quantized_index_dir: Optional[str]
+    node_index: Optional[Union[HNSWIndex, SQ8Index]]
+    edge_index: Optional[Union[HNSWIndex, SQ8Index]]
     def __init__(
-        self, *, db: TursoDB | SQLite, embedding_client: LiteLLMEmbeddingClient = ...
+        self,
+        *,
+        db: TursoDB | SQLite,
+        index_dimension: int,
+        embedding_client: LiteLLMEmbeddingClient = ...,
+        hnsw_index_dir: Optional[str] = ...,
+        quantized_index_dir: Optional[str] = ...,
     ) -> None: ...
     def initialize(self): ...
     def save(self): ...
     def add_node_embedding(
         self, id: Any, label: str, attribute: Dict[Any, Any]
     ) -> None: ...
+    def add_node_embeddings(
+        self, ids: List[Any], labels: List[str], attributes: List[Dict]
+    ) -> None: ...
     def add_edge_embedding(
         self, source: Any, target: Any, label: str, attributes: Dict
     ) -> None: ...
     def add_edge_embeddings(self, sources, targets, labels, attributes) -> None: ...
     def delete_node_embedding(self, id: Any) -> None: ...
+    def delete_node_embeddings(self, ids: Any) -> None: ...
     def delete_edge_embedding(self, ids: Any) -> None: ...
     def vector_search_node(
         self,
@@ -10,6 +10,10 @@ class VectorStore(ABC, metaclass=abc.ABCMeta):
     @abstractmethod
     def add_node_embedding(self, id: Any, label: str, attribute: Dict): ...
     @abstractmethod
+    def add_node_embeddings(
+        self, ids: List[Any], labels: List[str], attributes: List[Dict]
+    ) -> None: ...
+    @abstractmethod
     def add_edge_embedding(
         self, source: Any, target: Any, label: str, attributes: Dict
     ) -> None: ...
@@ -24,6 +28,8 @@ class VectorStore(ABC, metaclass=abc.ABCMeta):
     @abstractmethod
     def delete_node_embedding(self, id: Any) -> None: ...
     @abstractmethod
+    def delete_node_embeddings(self, ids: Any) -> None: ...
+    @abstractmethod
     def delete_edge_embedding(self, ids: Any) -> None: ...
     @abstractmethod
     def vector_search_node(
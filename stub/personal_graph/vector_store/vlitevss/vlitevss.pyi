@@ -19,6 +19,9 @@ class VliteVSS(VectorStore):
     def __eq__(self, other): ...
     def save(self) -> None: ...
     def add_node_embedding(self, id: Any, label: str, attribute: Dict): ...
+    def add_node_embeddings(
+        self, ids: List[Any], labels: List[str], attributes: List[Dict]
+    ) -> None: ...
     def add_edge_embedding(
         self, source: Any, target: Any, label: str, attributes: Dict
     ) -> None: ...
@@ -30,6 +33,7 @@ class VliteVSS(VectorStore):
         attributes: List[Dict[str, str]],
     ): ...
     def delete_node_embedding(self, ids: Any) -> None: ...
+    def delete_node_embeddings(self, ids: Any) -> None: ...
     def delete_edge_embedding(self, ids: Any) -> None: ...
     def vector_search_node(
         self,
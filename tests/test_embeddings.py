@@ -0,0 +1,78 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+from personal_graph import OpenAIEmbeddingsModel
+from personal_graph.embeddings_cache import EmbeddingsCache
+
+
+def _embeddings_response(input, **kwargs):
+    return SimpleNamespace(
+        data=[
+            SimpleNamespace(index=i, embedding=[float(len(text))])
+            for i, text in enumerate(input)
+        ]
+    )
+
+
+def test_get_embeddings_batches_requests():
+    client = Mock()
+    client.embeddings.create.side_effect = _embeddings_response
+    model = OpenAIEmbeddingsModel(client, "text-embedding-3-small", 384)
+    model.batch_size = 2
+
+    embeddings = model.get_embeddings(["a", "bb", "ccc"])
+
+    assert embeddings == [[1.0], [2.0], [3.0]]
+    assert client.embeddings.create.call_count == 2
+
+
+def test_get_embeddings_without_client(embedding_model):
+    assert embedding_model.get_embeddings(["a", "b"]) == [[], []]
+
+
+def test_get_embedding_uses_cache():
+    client = Mock()
+    client.embeddings.create.side_effect = _embeddings_response
+    model = OpenAIEmbeddingsModel(client, "text-embedding-3-small", 384)
+
+    assert model.get_embedding("hello") == [5.0]
+    assert model.get_embeddings(["hello", "hi", "hi"]) == [[5.0], [2.0], [2.0]]
+    assert model.get_embedding("hi") == [2.0]
+    assert client.embeddings.create.call_count == 2
+
+
+def test_get_embeddings_uses_disk_cache(tmp_path):
+    client = Mock()
+    client.embeddings.create.side_effect = _embeddings_response
+
+    first = OpenAIEmbeddingsModel(
+        client, "text-embedding-3-small", 384, disk_cache=EmbeddingsCache(str(tmp_path))
+    )
+    assert first.get_embeddings(["a", "bb"]) == [[1.0], [2.0]]
+
+    second = OpenAIEmbeddingsModel(
+        client, "text-embedding-3-small", 384, disk_cache=EmbeddingsCache(str(tmp_path))
+    )
+    assert second.get_embeddings(["bb", "a", "ccc"]) == [[2.0], [1.0], [3.0]]
+    assert client.embeddings.create.call_count == 2
+    assert client.embeddings.create.call_args.kwargs["input"] == ["ccc"]
+
+
+def test_aget_embeddings_runs_batches_concurrently():
+    async def _create(input, **kwargs):
+        return _embeddings_response(input)
+
+    async_client = Mock()
+    async_client.embeddings.create = AsyncMock(side_effect=_create)
+    model = OpenAIEmbeddingsModel(
+        Mock(), "text-embedding-3-small", 384, async_client=async_client
+    )
+    model.batch_size = 1
+
+    embeddings = asyncio.run(model.aget_embeddings(["a", "bb", "ccc", "a"]))
+
+    assert embeddings == [[1.0], [2.0], [3.0], [1.0]]
+    assert async_client.embeddings.create.await_count == 3
+    assert asyncio.run(model.aget_embedding("bb")) == [2.0]
+    assert async_client.embeddings.create.await_count == 3
@@ -0,0 +1,34 @@
+import pytest
+
+from personal_graph.vector_store.sqlitevss.hnsw import HNSWIndex
+
+pytest.importorskip("hnswlib")
+
+
+def test_hnsw_index_query_and_remove(tmp_path):
+    index = HNSWIndex(str(tmp_path / "nodes.bin"), 3)
+    index.add([1, 2, 3], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+    assert index.query([0.9, 0.0, 0.0], 1) == [(1, pytest.approx(0.01))]
+
+    index.remove([1])
+    assert {id for id, _ in index.query([0.9, 0.0, 0.0], 2)} == {2, 3}
+
+
+def test_hnsw_index_persists(tmp_path):
+    path = str(tmp_path / "edges.bin")
+    index = HNSWIndex(path, 2)
+    index.add([7], [[0.5, 0.5]])
+    index.save()
+
+    reloaded = HNSWIndex(path, 2)
+    assert reloaded.exists()
+    assert reloaded.query([0.5, 0.5], 5) == [(7, 0.0)]
+
+
+def test_hnsw_index_scans_exactly_when_few_elements_are_live(tmp_path):
+    index = HNSWIndex(str(tmp_path / "nodes.bin"), 2)
+    index.add([1, 2, 3], [[0.0, 0.0], [1.0, 0.0], [0.0, 3.0]])
+    index.remove([2])
+
+    assert index.query([0.0, 0.0], 3) == [(1, 0.0), (3, 9.0)]
@@ -0,0 +1,30 @@
+import numpy as np
+
+from personal_graph import kernels
+
+
+def test_l2_topk_orders_nearest_first():
+    candidates = [[0.0, 0.0], [3.0, 4.0], [1.0, 0.0], [0.0, 2.0]]
+
+    positions, distances = kernels.l2_topk(candidates, [0.0, 0.0], 3)
+
+    assert positions.tolist() == [0, 2, 3]
+    assert distances.tolist() == [0.0, 1.0, 4.0]
+
+
+def test_l2_topk_matches_numpy_fallback():
+    rng = np.random.default_rng(0)
+    candidates = rng.random((200, 16), dtype=np.float32)
+    query = rng.random(16, dtype=np.float32)
+
+    positions, distances = kernels.l2_topk(candidates, query, 10)
+    expected = kernels._squared_l2_numpy(candidates, query)
+
+    assert positions.tolist() == np.argsort(expected)[:10].tolist()
+    np.testing.assert_allclose(distances, np.sort(expected)[:10], rtol=1e-5)
+
+
+def test_l2_topk_empty():
+    positions, distances = kernels.l2_topk([], [1.0], 5)
+
+    assert len(positions) == 0 and len(distances) == 0
@@ -0,0 +1,55 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from personal_graph.database import TursoDB
+from personal_graph.database.pool import ConnectionPool
+
+
+def test_connection_pool_reuses_connections():
+    connect = Mock(side_effect=lambda: Mock())
+    pool = ConnectionPool(connect, max_size=1)
+
+    first = pool.get()
+    pool.put(first)
+    assert pool.get() is first
+
+    second = pool.get()
+    pool.put(first)
+    pool.put(second)
+    second.close.assert_called_once()
+    assert connect.call_count == 2
+
+
+def test_connection_pool_acquire_discards_on_error():
+    pool = ConnectionPool(Mock(side_effect=lambda: Mock()), max_size=2)
+
+    with pool.acquire() as connection:
+        pass
+    assert pool.get() is connection
+
+    with pytest.raises(ValueError):
+        with pool.acquire() as failed:
+            raise ValueError("boom")
+    failed.close.assert_called_once()
+
+
+def test_turso_atomic_discards_failed_connections():
+    with patch(
+        "personal_graph.database.tursodb.turso.libsql", create=True
+    ) as mock_libsql:
+        db = TursoDB(url="libsql://example.turso.io", auth_token="token")
+
+        db.atomic(lambda cursor, connection: None)
+        db.atomic(lambda cursor, connection: None)
+        assert mock_libsql.connect.call_count == 1
+        mock_libsql.connect.return_value.execute.assert_called_once_with(
+            "PRAGMA foreign_keys = TRUE;"
+        )
+
+        def _fail(cursor, connection):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            db.atomic(_fail)
+        mock_libsql.connect.return_value.close.assert_called_once()
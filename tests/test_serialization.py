@@ -0,0 +1,26 @@
+from unittest.mock import patch
+
+from personal_graph import serialization
+
+
+def test_dumps_is_the_same_with_and_without_orjson():
+    obj = {"name": "Zoë", "scores": [1, 2.5], "nested": {"ok": True, "none": None}}
+
+    with_orjson = serialization.dumps(obj)
+    with patch.object(serialization, "orjson", None):
+        without_orjson = serialization.dumps(obj)
+
+    assert with_orjson == without_orjson
+    assert serialization.loads(with_orjson) == obj
+
+
+def test_dumps_handles_integers_beyond_64_bits():
+    assert serialization.dumps({"big": 2**70}) == '{"big":1180591620717411303424}'
+
+
+def test_integers_beyond_64_bits_round_trip():
+    obj = {"big": 2**70, "negative": -(2**64), "text": "x" * 30}
+
+    assert serialization.loads(serialization.dumps(obj)) == obj
+    assert serialization.loads(serialization.dumps(obj).encode()) == obj
+    assert type(serialization.loads(serialization.dumps(obj))["big"]) is int
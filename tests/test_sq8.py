@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from personal_graph.kernels import quantize_sq8, sq8_l2_topk
+from personal_graph.vector_store.sqlitevss.sq8 import SQ8Index
+
+
+def test_quantize_sq8_round_trips_within_scale():
+    vectors = np.array([[0.5, -1.0, 0.25], [0.0, 0.0, 0.0]], dtype=np.float32)
+
+    codes, scales = quantize_sq8(vectors)
+
+    assert codes.dtype == np.int8
+    assert codes[0].tolist() == [64, -127, 32]
+    np.testing.assert_allclose(codes * scales[:, None], vectors, atol=scales[0])
+
+
+def test_sq8_l2_topk_matches_exact_neighbours():
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((500, 64)).astype(np.float32)
+    query = rng.standard_normal(64).astype(np.float32)
+    codes, scales = quantize_sq8(vectors)
+
+    positions, distances = sq8_l2_topk(
+        codes, scales, (vectors * vectors).sum(axis=1), query, 5
+    )
+    exact = ((vectors - query) ** 2).sum(axis=1)
+
+    assert positions.tolist() == np.argsort(exact)[:5].tolist()
+    np.testing.assert_allclose(distances, np.sort(exact)[:5], rtol=0.02)
+
+
+def test_sq8_index_query_remove_and_persist(tmp_path):
+    path = str(tmp_path / "nodes.npz")
+    index = SQ8Index(path, 2)
+    index.add([1, 2, 3], [[1.0, 0.0], [0.0, 1.0], [3.0, 3.0]])
+    index.remove([2])
+    index.add([1], [[0.0, 2.0]])
+    index.save()
+
+    reloaded = SQ8Index(path, 2)
+    assert reloaded.exists()
+    assert reloaded.query([0.0, 2.0], 5) == [
+        (1, pytest.approx(0.0, abs=1e-3)),
+        (3, pytest.approx(10.0, rel=0.01)),
+    ]
+
+
+def test_sq8_index_growth_keeps_ids_and_vectors_together(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((3000, 8)).astype(np.float32)
+    index = SQ8Index(str(tmp_path / "nodes.npz"), 8, initial_capacity=4)
+
+    for start in range(0, 3000, 7):
+        index.add(
+            list(range(start + 1, min(start + 8, 3001))), vectors[start : start + 7]
+        )
+    index.remove(list(range(1, 3001, 3)))
+    index.remove([99999])
+    index.add([2], [vectors[1] * 2])
+
+    live = [id for id in range(1, 3001) if id % 3 != 1]
+    assert len(index) == len(live)
+    assert index.max_id() == 3000
+    for id in (2, 3, 2999, 3000):
+        expected = vectors[id - 1] * (2 if id == 2 else 1)
+        [(found, distance)] = index.query(expected.tolist(), 1)
+        assert found == id
+        assert distance == pytest.approx(0.0, abs=0.1)
+
+
+def test_sq8_index_reranks_shortlist_with_exact_vectors(tmp_path):
+    rng = np.random.default_rng(2)
+    vectors = rng.standard_normal((1000, 32)).astype(np.float32)
+    query = rng.standard_normal(32).astype(np.float32)
+    index = SQ8Index(str(tmp_path / "nodes.npz"), 32)
+    index.add(list(range(1, 1001)), vectors)
+
+    fetched = []
+
+    def _vectors(ids):
+        fetched.append(ids)
+        return vectors[np.asarray(ids) - 1]
+
+    results = index.query(query.tolist(), 5, _vectors)
+
+    exact = ((vectors - query) ** 2).sum(axis=1)
+    assert len(fetched[0]) == 5 * SQ8Index.oversample
+    assert [id for id, _ in results] == (np.argsort(exact)[:5] + 1).tolist()
+    np.testing.assert_allclose([d for _, d in results], np.sort(exact)[:5], rtol=1e-5)
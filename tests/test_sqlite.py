@@ -0,0 +1,48 @@
+import pytest
+
+from personal_graph.database import SQLite
+
+
+@pytest.fixture
+def db():
+    db = SQLite(use_in_memory=True)
+    db.initialize()
+
+    for identifier in "abcde":
+        db.add_node("lbl", {"body": identifier}, identifier)
+    for source, target in [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e"), ("a", "e")]:
+        db.add_edge(source, target, "next", {"body": f"{source}->{target}"})
+
+    return db
+
+
+def test_traverse_without_target_visits_every_reachable_node(db):
+    assert db.traverse("a") == ["a", "b", "e", "c", "d"]
+
+
+def test_traverse_stops_at_target(db):
+    assert db.traverse("a", "c") == ["a", "b", "e", "c"]
+
+
+def test_traverse_with_bodies_stops_at_target_node(db):
+    path = db.traverse("a", "c", with_bodies=True)
+
+    assert path[-1] == ("c", "()", '{"body":"c","id":"c"}')
+    assert ("d", "()", '{"body":"d","id":"d"}') not in path
+
+
+def test_traverse_stops_at_integer_target():
+    db = SQLite(use_in_memory=True)
+    db.initialize()
+
+    for identifier in range(1, 6):
+        db.add_node("lbl", {"body": identifier}, identifier)
+    for source in range(1, 5):
+        db.add_edge(source, source + 1, "next", {"body": source})
+
+    assert db.traverse(1, 3) == ["1", "2", "3"]
+    assert db.traverse(1, 3, with_bodies=True)[-1] == (
+        "3",
+        "()",
+        '{"body":3,"id":3}',
+    )
@@ -0,0 +1,258 @@
+import array
+from unittest.mock import Mock, patch
+
+import pytest
+
+from personal_graph import GraphDB
+from personal_graph.database import SQLite
+from personal_graph.embeddings import EmbeddingsModel
+from personal_graph.models import EdgeInput, Node
+from personal_graph.vector_store import SQLiteVSS
+
+sqlite_vss = pytest.importorskip("sqlite_vss")
+
+
+class StubEmbeddingsModel(EmbeddingsModel):
+    def get_embedding(self, text: str) -> list[float]:
+        code = sum(map(ord, text))
+        return [float(code % 7), float(code % 5), float(len(text) % 3)]
+
+
+def _vector_store(local_path=None, **kwargs):
+    db = SQLite(
+        use_in_memory=local_path is None,
+        local_path=local_path,
+        vector0_so_path=sqlite_vss.vector_loadable_path(),
+        vss0_so_path=sqlite_vss.vss_loadable_path(),
+    )
+    db.initialize()
+
+    client = Mock()
+    client.get_embedding_model.return_value = StubEmbeddingsModel()
+    vector_store = SQLiteVSS(
+        db=db, index_dimension=3, embedding_client=client, **kwargs
+    )
+    vector_store.initialize()
+    return vector_store
+
+
+def _rows(vector_store, table, column):
+    cursor = vector_store.db._connection.cursor()
+    return [
+        (rowid, array.array("f", raw).tolist())
+        for rowid, raw in cursor.execute(
+            f"SELECT rowid, vector_to_raw({column}) FROM {table} ORDER BY rowid"
+        )
+    ]
+
+
+@pytest.fixture(params=["vss0", "hnsw", "quantized"])
+def sidecar(request, tmp_path):
+    if request.param == "hnsw":
+        pytest.importorskip("hnswlib")
+        return {"hnsw_index_dir": str(tmp_path / "index")}
+    if request.param == "quantized":
+        return {"quantized_index_dir": str(tmp_path / "index")}
+    return {}
+
+
+def test_hnsw_index_is_rebuilt_when_not_saved(tmp_path):
+    pytest.importorskip("hnswlib")
+    local_path = str(tmp_path / "graph.db")
+    index_dir = str(tmp_path / "index")
+
+    vector_store = _vector_store(local_path, hnsw_index_dir=index_dir)
+    for i in range(5):
+        vector_store.add_node_embedding(f"n{i}", "lbl", {"body": f"node {i}"})
+    vector_store.save()
+    for i in range(5, 10):
+        vector_store.add_node_embedding(f"n{i}", "lbl", {"body": f"node {i}"})
+    vector_store.delete_node_embedding((2,))
+
+    # Restart without saving the index after the last changes
+    expected = _vector_store(local_path).vector_search_node_from_multi_db(
+        {"body": "node 7", "id": "n7", "label": "lbl"}, threshold=100, limit=3
+    )
+    restarted = _vector_store(local_path, hnsw_index_dir=index_dir)
+
+    assert len(restarted.node_index) == 9
+    assert restarted.vector_search_node_from_multi_db(
+        {"body": "node 7", "id": "n7", "label": "lbl"}, threshold=100, limit=3
+    ) == [tuple(row) for row in expected]
+
+
+def test_quantized_index_search_matches_vss0(tmp_path):
+    local_path = str(tmp_path / "graph.db")
+    vector_store = _vector_store(
+        local_path, quantized_index_dir=str(tmp_path / "index")
+    )
+    for i in range(20):
+        vector_store.add_node_embedding(f"n{i}", "lbl", {"body": f"node {i}"})
+    vector_store.delete_node_embedding((4,))
+
+    query = {"body": "node 7", "id": "n7", "label": "lbl"}
+    expected = _vector_store(local_path).vector_search_node_from_multi_db(
+        query, threshold=100, limit=3
+    )
+
+    results = vector_store.vector_search_node_from_multi_db(
+        query, threshold=100, limit=3
+    )
+
+    # The stub embeddings tie, so only the exact distances are compared
+    assert [distance for _, distance in results] == [row[1] for row in expected]
+    assert results[0][0] == expected[0][0]
+
+
+def test_graph_remove_nodes_beyond_one_batch():
+    vector_store = _vector_store()
+    graph = GraphDB(
+        vector_store=vector_store, database=vector_store.db, graph_generator=Mock()
+    )
+    count = SQLite.remove_batch_size + 50
+    nodes = [
+        Node(id=f"n{i}", label="lbl", attributes={"body": f"node {i}"})
+        for i in range(count)
+    ]
+    graph.add_nodes(nodes)
+    # Both ends of every edge but the last are removed, so each is fetched twice,
+    # and n0 has more edges than fetch_edge_embed_ids returns per node
+    graph.add_edges(
+        [
+            EdgeInput(source=source, target=target, label="next", attributes={})
+            for source, target in zip(nodes, nodes[1:])
+        ]
+        + [
+            EdgeInput(source=nodes[0], target=target, label="hub", attributes={})
+            for target in nodes[2:20]
+        ]
+    )
+
+    db = vector_store.db
+    with patch.object(db, "atomic", wraps=db.atomic) as atomic:
+        graph.remove_nodes([node.id for node in nodes[:-1]] + ["missing"])
+
+    # One lookup, two embedding deletes and the node delete, whatever the count
+    assert atomic.call_count == 4
+
+    cursor = vector_store.db._connection.cursor()
+    assert cursor.execute("SELECT id FROM nodes").fetchall() == [(f"n{count - 1}",)]
+    assert cursor.execute("SELECT COUNT(*) FROM edges").fetchone() == (0,)
+    assert cursor.execute("SELECT COUNT(*) FROM nodes_embedding").fetchone() == (1,)
+    assert cursor.execute("SELECT COUNT(*) FROM relationship_embedding").fetchone() == (
+        0,
+    )
+
+
+def test_single_inserts_append_after_the_largest_rowid():
+    vector_store = _vector_store()
+    model = StubEmbeddingsModel()
+    for i in range(3):
+        vector_store.add_node_embedding(f"n{i}", "lbl", {"body": f"node {i}"})
+    vector_store.delete_node_embedding((2,))
+    vector_store.add_node_embedding("n3", "lbl", {"body": "node 3"})
+
+    rows = _rows(vector_store, "nodes_embedding", "vector_nodes")
+    assert [rowid for rowid, _ in rows] == [1, 3, 4]
+    assert rows[-1][1] == model.get_embedding(
+        '{"body":"node 3","id":"n3","label":"lbl"}'
+    )
+
+
+def test_batched_inserts_continue_after_single_inserts():
+    vector_store = _vector_store()
+    vector_store.add_edge_embedding("a", "b", "next", {})
+    vector_store.add_edge_embeddings(
+        ["b", "c", "d"], ["c", "d", "e"], ["next"] * 3, [{}] * 3
+    )
+    vector_store.add_edge_embedding("e", "f", "next", {})
+
+    rows = _rows(vector_store, "relationship_embedding", "vector_relations")
+    assert [rowid for rowid, _ in rows] == [1, 2, 3, 4, 5]
+
+
+def test_vector_search_node_with_and_without_sidecar(sidecar):
+    vector_store = _vector_store(**sidecar)
+    for i in range(10):
+        vector_store.db.add_node("lbl", {"body": f"node {i}"}, f"n{i}")
+        vector_store.add_node_embedding(f"n{i}", "lbl", {"body": f"node {i}"})
+
+    results = vector_store.vector_search_node(
+        {"body": "node 7", "id": "n7", "label": "lbl"}, threshold=100, limit=1
+    )
+
+    assert [row[:4] for row in results] == [
+        (8, "n7", "lbl", '{"body":"node 7","id":"n7"}')
+    ]
+    assert results[0][4] == pytest.approx(0.0)
+
+
+def test_updated_and_deleted_embeddings_leave_search(sidecar):
+    vector_store = _vector_store(**sidecar)
+    for i in range(5):
+        vector_store.add_node_embedding(f"n{i}", "lbl", {"body": f"node {i}"})
+
+    # An update adds the new embedding, then deletes the old one
+    vector_store.add_node_embedding("n1", "lbl", {"body": "node 1 again"})
+    vector_store.delete_node_embedding((2,))
+    vector_store.delete_node_embedding((4,))
+
+    results = vector_store.vector_search_node_from_multi_db(
+        {"body": "node 1 again", "id": "n1", "label": "lbl"}, threshold=100, limit=10
+    )
+
+    assert sorted(rowid for rowid, _ in results) == [1, 3, 5, 6]
+    assert dict(results)[6] == pytest.approx(0.0)
+
+
+def test_index_is_rebuilt_when_newest_rowid_is_reused(tmp_path, sidecar):
+    if not sidecar:
+        pytest.skip("vss0 keeps no index of its own")
+    local_path = str(tmp_path / "graph.db")
+
+    vector_store = _vector_store(local_path, **sidecar)
+    for i in range(5):
+        vector_store.add_node_embedding(f"n{i}", "lbl", {"body": f"node {i}"})
+    vector_store.save()
+    # Same count and largest rowid as the saved index, with a different vector
+    vector_store.delete_node_embedding((5,))
+    vector_store.add_node_embedding("n5", "lbl", {"body": "node 5 replaced"})
+
+    query = {"body": "node 5 replaced", "id": "n5", "label": "lbl"}
+    expected = _vector_store(local_path).vector_search_node_from_multi_db(
+        query, threshold=100, limit=2
+    )
+    restarted = _vector_store(local_path, **sidecar)
+
+    assert restarted.vector_search_node_from_multi_db(query, threshold=100, limit=2)[
+        0
+    ] == tuple(expected[0])
+
+
+def test_graph_bulk_inserts_embed_in_one_batch():
+    vector_store = _vector_store()
+    graph = GraphDB(
+        vector_store=vector_store, database=vector_store.db, graph_generator=Mock()
+    )
+    nodes = [
+        Node(id=f"n{i}", label="lbl", attributes={"body": f"node {i}"})
+        for i in range(5)
+    ]
+    graph.add_node(nodes[0])
+    model = vector_store.embedding_model
+
+    with patch.object(model, "get_embeddings", wraps=model.get_embeddings) as spy:
+        graph.add_nodes(nodes)
+        graph.add_edges(
+            [
+                EdgeInput(source=source, target=target, label="next", attributes={})
+                for source, target in zip(nodes, nodes[1:])
+            ]
+        )
+
+    # Node n0 already exists, so only the four new nodes are embedded
+    assert [len(call.args[0]) for call in spy.call_args_list] == [4, 4]
+    results = vector_store.vector_search_node(
+        {"body": "node 3", "id": "n3", "label": "lbl"}, threshold=100, limit=1
+    )
+    assert [row[:2] for row in results] == [(4, "n3")]